@@ -11,6 +11,7 @@ from ..config.constants import (
     MAX_THREADS
 )
 from ..utils.file_utils import clean_folder_name
+from ..services.multipart_downloader import PauseEvent
 
 
 class DownloadManager:
@@ -32,7 +33,7 @@ class DownloadManager:
         self.thread_pool = None
         self.active_futures = []
         self.cancellation_event = threading.Event()
-        self.pause_event = threading.Event()
+        self.pause_event = PauseEvent()
         self.is_running = False
         
         self.total_posts = 0
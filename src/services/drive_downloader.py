@@ -611,13 +611,11 @@ def download_gofile_folder(gofile_url, download_path, logger_func=print, progres
     except Exception as e:
         logger_func(f"   [Gofile] ⚠️ Could not configure retry strategy: {e}")
 
+    # Fetched one after the other: the cloudscraper session (cookies, challenge state) isn't thread-safe
     api_token = _get_gofile_api_token(scraper, logger_func)
-    if not api_token:
-        if overall_progress_callback: overall_progress_callback(1, 1)
-        return
+    website_token = _get_gofile_website_token(scraper, logger_func) if api_token else None
 
-    website_token = _get_gofile_website_token(scraper, logger_func)
-    if not website_token:
+    if not api_token or not website_token:
         if overall_progress_callback: overall_progress_callback(1, 1)
         return
 
@@ -660,13 +658,37 @@ def download_gofile_folder(gofile_url, download_path, logger_func=print, progres
         download_session.mount("http://", adapter)
         download_session.mount("https://", adapter)
 
+        # List the folder once so the skip check below is a dict lookup, not a stat per file.
+        # Names are normcase'd so the lookup is case-insensitive on Windows, like os.path.exists was.
+        existing_file_sizes = {}
+        with os.scandir(final_download_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    existing_file_sizes[os.path.normcase(entry.name)] = entry.stat().st_size
+
+        # normcase'd names already assigned to an entry of this listing, so two entries
+        # differing only by case don't end up on the same file on Windows
+        planned_targets = set()
+
         for i, file_info in enumerate(files_to_download):
             filename = file_info.get("name")
             file_url = file_info.get("link")
             file_size = file_info.get("size", 0)
+
+            target_key = os.path.normcase(filename)
+            if target_key in planned_targets:
+                stem, ext = os.path.splitext(filename)
+                suffix_num = 1
+                while os.path.normcase(f"{stem} ({suffix_num}){ext}") in planned_targets:
+                    suffix_num += 1
+                renamed = f"{stem} ({suffix_num}){ext}"
+                logger_func(f"   [Gofile] ⚠️ '{filename}' collides with another file in this folder. Saving as '{renamed}'.")
+                filename = renamed
+                target_key = os.path.normcase(filename)
+            planned_targets.add(target_key)
             filepath = os.path.join(final_download_path, filename)
             
-            if os.path.exists(filepath) and os.path.getsize(filepath) == file_size:
+            if existing_file_sizes.get(target_key) == file_size:
                 logger_func(f"   [Gofile] ({i+1}/{len(files_to_download)}) ⏩ Skipping existing file: '{filename}'")
                 if overall_progress_callback: overall_progress_callback(len(files_to_download), i + 1)
                 continue
@@ -699,5 +721,5 @@ def download_gofile_folder(gofile_url, download_path, logger_func=print, progres
 
     except Exception as e:
         logger_func(f"   [Gofile] ❌ An error occurred during Gofile download: {e}")
-        if not isinstance(e, requests.exceptions.RequestException):
+        if not isinstance(e, (requests.exceptions.RequestException, OSError)):
             traceback.print_exc()
@@ -1,7 +1,10 @@
 # --- Standard Library Imports ---
 # --- Standard Library Imports ---
 import os
+import mmap
 import time
+import random
+import math
 import hashlib
 import http.client
 import traceback
@@ -14,16 +17,195 @@ import requests
 MULTIPART_DOWNLOADER_AVAILABLE = True
 
 # --- Module Constants ---
-CHUNK_DOWNLOAD_RETRY_DELAY = 2
+CHUNK_DOWNLOAD_MAX_BACKOFF = 30  # Upper bound (seconds) for any single retry wait
 MAX_CHUNK_DOWNLOAD_RETRIES = 5
+RETRYABLE_HTTP_STATUS_CODES = (408, 425, 429, 500, 502, 503, 504)
 DOWNLOAD_CHUNK_SIZE_ITER = 1024 * 256  # 256 KB per iteration chunk
+WRITE_BATCH_SIZE = 1024 * 1024  # Flush buffered segments to disk once per ~1 MB
+PROGRESS_PUBLISH_INTERVAL = 0.25  # Seconds between a chunk's updates to the shared progress data
+PROGRESS_PUBLISH_SEGMENTS = 64  # ...or after this many segments, whichever comes first
+PAUSE_CHECK_INTERVAL = 1.0  # Fallback wake-up (seconds) of a paused chunk thread, so it still notices cancellation
+
+# --- Adaptive part count ---
+SPEED_PROBE_BYTES = 4 * 1024 * 1024  # Max bytes fetched over one connection to measure its speed
+SPEED_PROBE_MAX_SECONDS = 2.0
+ADAPTIVE_TARGET_BPS = 50 * 1024 * 1024  # Aggregate speed (bytes/s) the part count aims for
+MIN_ADAPTIVE_PARTS = 2
+
+
+def _get_retry_delay(attempt, retry_after=None):
+    """
+    Returns how long to wait before the given retry attempt.
+
+    A server-provided 'Retry-After' value (in seconds) takes priority. Otherwise
+    an exponential backoff with jitter is used so parallel chunks don't retry in lockstep.
+    """
+    if retry_after is not None:
+        try:
+            return min(CHUNK_DOWNLOAD_MAX_BACKOFF, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            pass  # HTTP-date form or garbage; fall back to our own backoff
+    return min(CHUNK_DOWNLOAD_MAX_BACKOFF, (2 ** attempt) + random.random())
+
+
+def _write_segments(raw_file, segments):
+    """
+    Writes a batch of buffered segments to an unbuffered file in as few syscalls as possible.
+
+    Uses vectored I/O (os.writev) where the platform provides it and falls back to a
+    single joined write otherwise (e.g., on Windows). Partial writes are completed.
+    """
+    if hasattr(os, 'writev'):
+        total = sum(len(seg) for seg in segments)
+        written = os.writev(raw_file.fileno(), segments)
+        if written == total:
+            return
+        remaining = memoryview(b''.join(segments))[written:]
+    else:
+        remaining = memoryview(b''.join(segments))
+    while remaining:
+        remaining = remaining[raw_file.write(remaining):]
+
+
+def _measure_connection_speed(file_url, headers, cookies, cancellation_event, logger_func, probe_part_path):
+    """
+    Measures single-connection throughput by streaming the start of the file for a short time.
+
+    The probed bytes are the start of the file, so they are kept in 'probe_part_path'
+    (the first part file) and chunk 0 later resumes after them instead of refetching them.
+
+    Returns:
+        float or None: The measured speed in bytes per second, or None if it could not be measured.
+    """
+    probe_headers = headers.copy()
+    probe_headers['Range'] = f"bytes=0-{SPEED_PROBE_BYTES - 1}"
+    received = 0
+    try:
+        with requests.get(file_url, headers=probe_headers, timeout=(10, 30), stream=True, cookies=cookies) as response, \
+                open(probe_part_path, 'wb') as probe_file:
+            response.raise_for_status()
+            start_time = time.monotonic()
+            for data_segment in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_ITER):
+                if cancellation_event and cancellation_event.is_set():
+                    return None
+                # A server ignoring Range sends the whole file; keep no more than was asked for
+                data_segment = data_segment[:SPEED_PROBE_BYTES - received]
+                probe_file.write(data_segment)
+                received += len(data_segment)
+                if received >= SPEED_PROBE_BYTES or time.monotonic() - start_time >= SPEED_PROBE_MAX_SECONDS:
+                    break
+            elapsed = time.monotonic() - start_time
+    except (requests.exceptions.RequestException, OSError) as e:
+        logger_func(f"   ⚠️ Connection speed probe failed: {e}")
+        return None
+    if received == 0 or elapsed <= 0:
+        return None
+    return received / elapsed
+
+
+def _read_part_count(save_path):
+    """Returns the part count recorded for an unfinished download of 'save_path', or None."""
+    try:
+        with open(f"{save_path}.parts", 'r', encoding='utf-8') as f:
+            count = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    return count if count > 0 else None
+
+
+def _write_part_count(save_path, num_parts, logger_func):
+    """Records the part count used for 'save_path', so a resume splits the file the same way."""
+    try:
+        with open(f"{save_path}.parts", 'w', encoding='utf-8') as f:
+            f.write(str(num_parts))
+    except OSError as e:
+        logger_func(f"   ⚠️ Could not record part count for resume: {e}")
+
+
+def _choose_num_parts(max_parts, measured_bps):
+    """
+    Picks just enough parallel connections to reach ADAPTIVE_TARGET_BPS at the
+    measured per-connection speed, bounded by the configured maximum.
+    """
+    if not measured_bps:
+        return max_parts
+    needed_parts = math.ceil(ADAPTIVE_TARGET_BPS / measured_bps)
+    return min(max_parts, max(MIN_ADAPTIVE_PARTS, needed_parts))
+
+
+class PauseEvent(threading.Event):
+    """
+    A pause flag (set while paused) that paused threads can also block on until
+    the pause is lifted, instead of polling is_set(). It is a drop-in replacement
+    for the plain threading.Event used as 'pause_event' throughout the app.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._resumed = threading.Event()
+        self._resumed.set()
+
+    def set(self):
+        self._resumed.clear()
+        super().set()
+
+    def clear(self):
+        super().clear()
+        self._resumed.set()
+
+    def wait_for_resume(self, timeout=None):
+        """Blocks until the pause is lifted or 'timeout' passes. Returns True if resumed."""
+        return self._resumed.wait(timeout)
+
+
+def _wait_while_paused(pause_event, cancellation_event):
+    """
+    Blocks while 'pause_event' is set.
+
+    With a PauseEvent the thread sleeps until resume wakes it; otherwise it waits on
+    the cancellation event. Either way PAUSE_CHECK_INTERVAL only bounds how long a
+    cancel (or a resume of a plain Event) can go unnoticed.
+
+    Returns:
+        bool: True if the download was cancelled while paused, False once resumed.
+    """
+    wait_for_resume = getattr(pause_event, 'wait_for_resume', None)
+    while pause_event.is_set():
+        if cancellation_event and cancellation_event.is_set():
+            return True
+        if wait_for_resume:
+            wait_for_resume(PAUSE_CHECK_INTERVAL)
+        elif cancellation_event:
+            if cancellation_event.wait(PAUSE_CHECK_INTERVAL):
+                return True
+        else:
+            time.sleep(PAUSE_CHECK_INTERVAL)
+    return False
+
+
+def _preallocate_file(file_obj, size):
+    """
+    Reserves 'size' bytes for a freshly opened file so the filesystem can lay it
+    out contiguously instead of growing it write by write.
+    Falls back to truncate() where posix_fallocate is unavailable (e.g., Windows).
+    """
+    if size <= 0:
+        return
+    try:
+        os.posix_fallocate(file_obj.fileno(), 0, size)
+    except (OSError, AttributeError):
+        try:
+            file_obj.truncate(size)
+            file_obj.seek(0)
+        except OSError:
+            pass  # Preallocation is only an optimization
 
 
 def _download_individual_chunk(
     chunk_url, chunk_temp_file_path, start_byte, end_byte, headers,
     part_num, total_parts, progress_data, cancellation_event,
     skip_event, pause_event, global_emit_time_ref, cookies_for_chunk,
-    logger_func, emitter=None, api_original_filename=None
+    logger_func, emitter=None, api_original_filename=None, resume_offset=0
 ):
     """
     Downloads a single segment (chunk) of a larger file to its own unique part file.
@@ -51,9 +233,12 @@ def _download_individual_chunk(
         logger_func (function): A function to log messages.
         emitter (queue.Queue or QObject): Emitter for sending progress to the UI.
         api_original_filename (str): The original filename for UI display.
+        resume_offset (int): Bytes already present at the start of the chunk file (kept
+                             from the speed probe); only the rest of the range is fetched.
 
     Returns:
-        tuple: A tuple containing (bytes_downloaded, success_flag).
+        tuple: A tuple containing (bytes_downloaded, success_flag). bytes_downloaded
+               excludes the resume_offset bytes.
     """
     # --- Pre-download checks for control events ---
     if cancellation_event and cancellation_event.is_set():
@@ -64,26 +249,30 @@ def _download_individual_chunk(
         return 0, False
     if pause_event and pause_event.is_set():
         logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Download paused before start...")
-        while pause_event.is_set():
-            if cancellation_event and cancellation_event.is_set():
-                logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Download cancelled while paused.")
-                return 0, False
-            time.sleep(0.2)
+        if _wait_while_paused(pause_event, cancellation_event):
+            logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Download cancelled while paused.")
+            return 0, False
         logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Download resumed.")
 
     # Set this chunk's status to 'active' before starting the download.
     with progress_data['lock']:
         progress_data['chunks_status'][part_num]['active'] = True
 
+    # A dedicated session per chunk keeps its connection alive across retries
+    # without competing with the other chunks for a shared connection pool.
+    session = requests.Session()
+
     try:
         # Prepare headers for the specific byte range of this chunk
         chunk_headers = headers.copy()
         if end_byte != -1:
-            chunk_headers['Range'] = f"bytes={start_byte}-{end_byte}"
+            chunk_headers['Range'] = f"bytes={start_byte + resume_offset}-{end_byte}"
 
         bytes_this_chunk = 0
+        bytes_published = 0  # Portion of bytes_this_chunk already added to the shared progress data
         last_speed_calc_time = time.time()
         bytes_at_last_speed_calc = 0
+        retry_after = None
 
         # --- Retry Loop ---
         for attempt in range(MAX_CHUNK_DOWNLOAD_RETRIES + 1):
@@ -93,41 +282,70 @@ def _download_individual_chunk(
             try:
                 if attempt > 0:
                     logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Retrying (Attempt {attempt + 1}/{MAX_CHUNK_DOWNLOAD_RETRIES + 1})...")
-                    time.sleep(CHUNK_DOWNLOAD_RETRY_DELAY * (2 ** (attempt - 1)))
+                    time.sleep(_get_retry_delay(attempt, retry_after))
+                    retry_after = None
+                    # The chunk file is rewritten from resume_offset, so roll back the partial progress.
+                    with progress_data['lock']:
+                        progress_data['total_downloaded_so_far'] -= bytes_published
+                        progress_data['chunks_status'][part_num]['downloaded'] = resume_offset
+                    bytes_this_chunk = 0
+                    bytes_published = 0
                     last_speed_calc_time = time.time()
                     bytes_at_last_speed_calc = bytes_this_chunk
 
-                logger_func(f"   🚀 [Chunk {part_num + 1}/{total_parts}] Starting download: bytes {start_byte}-{end_byte if end_byte != -1 else 'EOF'}")
+                logger_func(f"   🚀 [Chunk {part_num + 1}/{total_parts}] Starting download: bytes {start_byte + resume_offset}-{end_byte if end_byte != -1 else 'EOF'}")
 
-                response = requests.get(chunk_url, headers=chunk_headers, timeout=(10, 120), stream=True, cookies=cookies_for_chunk)
+                response = session.get(chunk_url, headers=chunk_headers, timeout=(10, 120), stream=True, cookies=cookies_for_chunk)
                 response.raise_for_status()
 
                 # --- Data Writing Loop ---
-                # We open the unique chunk file in write-binary ('wb') mode.
-                # No more seeking is required.
-                with open(chunk_temp_file_path, 'wb') as f:
+                # We open the unique chunk file in write-binary ('wb') mode, or keep its first
+                # resume_offset bytes and append after them. Segments are batched here and
+                # flushed with vectored writes, so Python-level buffering is disabled.
+                write_batch = []
+                write_batch_bytes = 0
+                segments_since_publish = 0
+                last_publish_time = time.time()
+                with open(chunk_temp_file_path, 'r+b' if resume_offset else 'wb', buffering=0) as f:
+                    if resume_offset:
+                        f.truncate(resume_offset)
+                        f.seek(resume_offset)
                     for data_segment in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_ITER):
                         if cancellation_event and cancellation_event.is_set():
                             return bytes_this_chunk, False
                         if pause_event and pause_event.is_set():
                             # Handle pausing during the download stream
                             logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Paused...")
-                            while pause_event.is_set():
-                                if cancellation_event and cancellation_event.is_set(): return bytes_this_chunk, False
-                                time.sleep(0.2)
+                            if _wait_while_paused(pause_event, cancellation_event):
+                                return bytes_this_chunk, False
                             logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Resumed.")
 
                         if data_segment:
-                            f.write(data_segment)
+                            write_batch.append(data_segment)
+                            write_batch_bytes += len(data_segment)
+                            if write_batch_bytes >= WRITE_BATCH_SIZE:
+                                _write_segments(f, write_batch)
+                                write_batch.clear()
+                                write_batch_bytes = 0
                             bytes_this_chunk += len(data_segment)
+                            segments_since_publish += 1
+
+                            # Publish to the shared progress data only periodically, so the
+                            # chunk threads don't contend for the lock on every segment.
+                            current_time = time.time()
+                            if (segments_since_publish < PROGRESS_PUBLISH_SEGMENTS and
+                                    current_time - last_publish_time < PROGRESS_PUBLISH_INTERVAL):
+                                continue
+                            segments_since_publish = 0
+                            last_publish_time = current_time
+                            status_list_ref = None
 
-                            # Update shared progress data structure
                             with progress_data['lock']:
-                                progress_data['total_downloaded_so_far'] += len(data_segment)
-                                progress_data['chunks_status'][part_num]['downloaded'] = bytes_this_chunk
+                                progress_data['total_downloaded_so_far'] += bytes_this_chunk - bytes_published
+                                progress_data['chunks_status'][part_num]['downloaded'] = resume_offset + bytes_this_chunk
+                                bytes_published = bytes_this_chunk
 
                                 # Calculate and update speed for this chunk
-                                current_time = time.time()
                                 time_delta = current_time - last_speed_calc_time
                                 if time_delta > 0.5:
                                     bytes_delta = bytes_this_chunk - bytes_at_last_speed_calc
@@ -136,31 +354,56 @@ def _download_individual_chunk(
                                     last_speed_calc_time = current_time
                                     bytes_at_last_speed_calc = bytes_this_chunk
 
-                                # Emit progress signal to the UI via the queue
                                 if emitter and (current_time - global_emit_time_ref[0] > 0.25):
                                     global_emit_time_ref[0] = current_time
-                                    status_list_copy = [dict(s) for s in progress_data['chunks_status']]
-                                    if isinstance(emitter, queue.Queue):
-                                        emitter.put({'type': 'file_progress', 'payload': (api_original_filename, status_list_copy)})
-                                    elif hasattr(emitter, 'file_progress_signal'):
-                                        emitter.file_progress_signal.emit(api_original_filename, status_list_copy)
+                                    status_list_ref = progress_data['chunks_status']
+
+                            # Emit progress signal to the UI outside the lock. The status dicts only
+                            # hold small numbers, so a slightly stale copy is fine for display.
+                            if status_list_ref is not None:
+                                status_list_copy = [dict(s) for s in status_list_ref]
+                                if isinstance(emitter, queue.Queue):
+                                    emitter.put({'type': 'file_progress', 'payload': (api_original_filename, status_list_copy)})
+                                elif hasattr(emitter, 'file_progress_signal'):
+                                    emitter.file_progress_signal.emit(api_original_filename, status_list_copy)
+
+                    if write_batch:
+                        _write_segments(f, write_batch)
+
+                if bytes_this_chunk != bytes_published:
+                    with progress_data['lock']:
+                        progress_data['total_downloaded_so_far'] += bytes_this_chunk - bytes_published
+                        progress_data['chunks_status'][part_num]['downloaded'] = resume_offset + bytes_this_chunk
+                    bytes_published = bytes_this_chunk
 
                 # If we get here, the download for this chunk is successful
                 return bytes_this_chunk, True
 
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, http.client.IncompleteRead) as e:
+            except requests.exceptions.HTTPError as e:
+                status_code = e.response.status_code if e.response is not None else None
+                if status_code not in RETRYABLE_HTTP_STATUS_CODES:
+                    logger_func(f"   ❌ [Chunk {part_num + 1}/{total_parts}] Non-retryable HTTP error: {e}")
+                    return bytes_this_chunk, False
+                retry_after = e.response.headers.get('Retry-After')
+                logger_func(f"   ❌ [Chunk {part_num + 1}/{total_parts}] Retryable HTTP error ({status_code}): {e}")
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError, http.client.IncompleteRead,
+                    ConnectionResetError) as e:
                 logger_func(f"   ❌ [Chunk {part_num + 1}/{total_parts}] Retryable error: {e}")
             except requests.exceptions.RequestException as e:
                 logger_func(f"   ❌ [Chunk {part_num + 1}/{total_parts}] Non-retryable error: {e}")
                 return bytes_this_chunk, False # Break loop on non-retryable errors
             except Exception as e:
-                logger_func(f"   ❌ [Chunk {part_num + 1}/{total_parts}] Unexpected error: {e}\n{traceback.format_exc(limit=1)}")
+                logger_func(f"   ❌ [Chunk {part_num + 1}/{total_parts}] Unexpected error: {type(e).__name__}: {e}")
+                if not isinstance(e, (OSError, ValueError)):
+                    traceback.print_exc()  # Full trace only for genuinely unknown failure modes
                 return bytes_this_chunk, False
 
         # If the retry loop finishes without a successful download
         return bytes_this_chunk, False
     finally:
         # This block runs whether the download succeeded or failed
+        session.close()
         with progress_data['lock']:
             progress_data['chunks_status'][part_num]['active'] = False
             progress_data['chunks_status'][part_num]['speed_bps'] = 0.0
@@ -183,7 +426,8 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
         file_url (str): The URL of the file to download.
         save_path (str): The final desired path for the downloaded file (e.g., 'my_video.mp4').
         total_size (int): The total size of the file in bytes.
-        num_parts (int): The number of parts to split the download into.
+        num_parts (int): The maximum number of parts to split the download into. Fresh downloads
+                         may use fewer if a single connection is already fast enough.
         headers (dict): HTTP headers for the download requests.
         api_original_filename (str): The original filename for UI progress display.
         emitter_for_multipart (queue.Queue or QObject): Emitter for UI signals.
@@ -196,7 +440,29 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
     Returns:
         tuple: A tuple containing (success_flag, total_bytes_downloaded, md5_hash, file_handle).
                The file_handle will be for the final assembled file if successful, otherwise None.
+               The MD5 hex digest is compatible with the hashes used for duplicate detection.
     """
+    # --- Part count ---
+    # A resumed download must be split exactly as before, so the count chosen for it is
+    # kept in a '.parts' sidecar. Fresh downloads may pick fewer parts than configured.
+    recorded_num_parts = _read_part_count(save_path)
+    if recorded_num_parts:
+        if recorded_num_parts != num_parts:
+            logger_func(f"   ℹ️ Resuming with the {recorded_num_parts} parts this download was started with.")
+        num_parts = recorded_num_parts
+    else:
+        # Part files without a sidecar predate it and were sized for the configured count
+        has_existing_parts = any(os.path.exists(f"{save_path}.part{i}") for i in range(num_parts))
+        if num_parts > MIN_ADAPTIVE_PARTS and total_size > SPEED_PROBE_BYTES * num_parts and not has_existing_parts:
+            measured_bps = _measure_connection_speed(
+                file_url, headers, cookies_for_chunk_session, cancellation_event, logger_func, f"{save_path}.part0"
+            )
+            adaptive_num_parts = _choose_num_parts(num_parts, measured_bps)
+            if adaptive_num_parts != num_parts:
+                logger_func(f"   ℹ️ Single connection measured at {measured_bps / (1024*1024):.2f} MB/s. Using {adaptive_num_parts} of {num_parts} parts.")
+                num_parts = adaptive_num_parts
+        _write_part_count(save_path, num_parts, logger_func)
+
     logger_func(f"⬇️ Initializing Resumable Multi-part Download ({num_parts} parts) for: '{api_original_filename}' (Size: {total_size / (1024*1024):.2f} MB)")
 
     # Calculate the byte range for each chunk
@@ -225,12 +491,18 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
     for i, (start, end) in enumerate(chunks_ranges):
         chunk_part_path = f"{save_path}.part{i}"
         expected_chunk_size = chunk_actual_sizes[i]
+        existing_size = os.path.getsize(chunk_part_path) if os.path.exists(chunk_part_path) else 0
 
-        if os.path.exists(chunk_part_path) and os.path.getsize(chunk_part_path) == expected_chunk_size:
+        if existing_size == expected_chunk_size and os.path.exists(chunk_part_path):
             logger_func(f"   [Chunk {i + 1}/{num_parts}] Resuming with existing complete chunk file.")
             total_bytes_resumed += expected_chunk_size
+        elif i == 0 and 0 < existing_size < expected_chunk_size:
+            # Part 0 always starts at byte 0, so a partial one (e.g. the speed probe) is a valid prefix
+            logger_func(f"   [Chunk 1/{num_parts}] Continuing after {existing_size} existing bytes.")
+            total_bytes_resumed += existing_size
+            chunks_to_download.append({'index': i, 'start': start, 'end': end, 'resume_offset': existing_size})
         else:
-            chunks_to_download.append({'index': i, 'start': start, 'end': end})
+            chunks_to_download.append({'index': i, 'start': start, 'end': end, 'resume_offset': 0})
 
     # Setup the shared progress data structure
     progress_data = {
@@ -240,11 +512,12 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
         'lock': threading.Lock(),
         'last_global_emit_time': [time.time()]
     }
+    resume_offsets = {c['index']: c['resume_offset'] for c in chunks_to_download}
     for i in range(num_parts):
-        is_resumed = not any(c['index'] == i for c in chunks_to_download)
+        is_resumed = i not in resume_offsets
         progress_data['chunks_status'].append({
             'id': i,
-            'downloaded': chunk_actual_sizes[i] if is_resumed else 0,
+            'downloaded': chunk_actual_sizes[i] if is_resumed else resume_offsets[i],
             'total': chunk_actual_sizes[i],
             'active': False,
             'speed_bps': 0.0
@@ -273,7 +546,8 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
                 skip_event=skip_event, global_emit_time_ref=progress_data['last_global_emit_time'],
                 pause_event=pause_event, cookies_for_chunk=cookies_for_chunk_session,
                 logger_func=logger_func, emitter=emitter_for_multipart,
-                api_original_filename=api_original_filename
+                api_original_filename=api_original_filename,
+                resume_offset=chunk_info['resume_offset']
             )
             chunk_futures.append(future)
 
@@ -294,15 +568,22 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
     # --- Assembly and Cleanup Phase ---
     if all_chunks_successful and (total_bytes_final == total_size or total_size == 0):
         logger_func(f"   ✅ All {num_parts} chunks complete. Assembling final file...")
+        # MD5 is kept deliberately: the hash is compared against single-stream downloads
+        # and persisted in session files for duplicate detection, so it must match them.
         md5_hasher = hashlib.md5()
         try:
             with open(save_path, 'wb') as final_file:
+                _preallocate_file(final_file, total_size)
                 for i in range(num_parts):
                     chunk_part_path = f"{save_path}.part{i}"
                     with open(chunk_part_path, 'rb') as chunk_file:
-                        content = chunk_file.read()
-                        final_file.write(content)
-                        md5_hasher.update(content)
+                        if os.fstat(chunk_file.fileno()).st_size == 0:
+                            continue  # mmap cannot map an empty file
+                        # Map the chunk instead of reading it into memory; both write()
+                        # and update() consume the buffer directly without copying.
+                        with mmap.mmap(chunk_file.fileno(), 0, access=mmap.ACCESS_READ) as chunk_map:
+                            final_file.write(chunk_map)
+                            md5_hasher.update(chunk_map)
             
             calculated_hash = md5_hasher.hexdigest()
             logger_func(f"   ✅ Assembly successful for '{api_original_filename}'. Total bytes: {total_bytes_final}")
@@ -319,6 +600,10 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
                         os.remove(chunk_part_path)
                     except OSError as e:
                         logger_func(f"    ⚠️ Failed to remove temp part file '{chunk_part_path}': {e}")
+            try:
+                os.remove(f"{save_path}.parts")
+            except OSError:
+                pass  # No sidecar was written (or it is already gone)
     else:
         # If download failed, we do NOT clean up, allowing for resumption later
         logger_func(f"   ❌ Multi-part download failed for '{api_original_filename}'. Success: {all_chunks_successful}, Bytes: {total_bytes_final}/{total_size}. Partial chunks saved for future resumption.")
@@ -1,29 +1,95 @@
 import sys
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import subprocess # Keep this for now, though it's not used in the final command
 from packaging.version import parse as parse_version
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 # Constants for the updater
 GITHUB_REPO_URL = "https://api.github.com/repos/Yuvi63771/Kemono-Downloader/releases/latest"
 EXE_NAME = "Kemono.Downloader.exe"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+PROGRESS_EMIT_INTERVAL = 0.5  # Seconds between download_progress emissions
+PREFETCH_MAX_AGE = 300  # Seconds a prefetched release stays usable before it is refetched
 
-class UpdateChecker(QThread):
-    """Checks for a new version on GitHub in a background thread."""
+_prefetch_executor = None
+_prefetched_release_future = None
+_prefetched_at = 0.0  # time.monotonic() when the pending prefetch was started
+_prefetch_lock = threading.Lock()
+
+
+def _fetch_latest_release():
+    """Fetches the latest release information from the GitHub API."""
+    response = requests.get(GITHUB_REPO_URL, timeout=15)
+    response.raise_for_status()
+    return response.json()
+
+
+def prefetch_latest_release():
+    """
+    Starts fetching the latest release information in the background, so a
+    following UpdateChecker can use the result instead of waiting on the network.
+    Does nothing if a prefetch younger than PREFETCH_MAX_AGE is already pending.
+    """
+    global _prefetch_executor, _prefetched_release_future, _prefetched_at
+    with _prefetch_lock:
+        if _prefetched_release_future is not None and time.monotonic() - _prefetched_at < PREFETCH_MAX_AGE:
+            return
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="UpdatePrefetch")
+        _prefetched_release_future = _prefetch_executor.submit(_fetch_latest_release)
+        _prefetched_at = time.monotonic()
+
+
+def _take_prefetched_release():
+    """
+    Returns the pending prefetch future and clears it, so each prefetch is used once.
+    Returns None if there is none or it is older than PREFETCH_MAX_AGE (stale data).
+    """
+    global _prefetched_release_future
+    with _prefetch_lock:
+        future = _prefetched_release_future
+        _prefetched_release_future = None
+        if future is not None and time.monotonic() - _prefetched_at >= PREFETCH_MAX_AGE:
+            return None
+        return future
+
+
+class UpdateCheckerSignals(QObject):
+    """Signals emitted by UpdateChecker (a QRunnable can't define signals itself)."""
     update_available = pyqtSignal(str, str)  # new_version, download_url
     up_to_date = pyqtSignal(str)
     update_error = pyqtSignal(str)
 
+
+class UpdateDownloaderSignals(QObject):
+    """Signals emitted by UpdateDownloader."""
+    download_finished = pyqtSignal()
+    download_error = pyqtSignal(str)
+    download_progress = pyqtSignal(int, int)  # downloaded_bytes, total_bytes (0 if unknown)
+
+
+class UpdateChecker(QRunnable):
+    """
+    Checks for a new version on GitHub. Runs on the shared QThreadPool via start(),
+    so repeated checks reuse pool threads instead of creating a new one each time.
+    """
     def __init__(self, current_version):
         super().__init__()
+        self.signals = UpdateCheckerSignals()
         self.current_version_str = current_version.lstrip('v')
 
+    def start(self):
+        """Queues the check on the application's shared thread pool."""
+        QThreadPool.globalInstance().start(self)
+
     def run(self):
         try:
-            response = requests.get(GITHUB_REPO_URL, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            prefetched = _take_prefetched_release()
+            data = prefetched.result() if prefetched else _fetch_latest_release()
 
             latest_version_str = data['tag_name'].lstrip('v')
             current_version = parse_version(self.current_version_str)
@@ -32,31 +98,34 @@ class UpdateChecker(QThread):
             if latest_version > current_version:
                 for asset in data.get('assets', []):
                     if asset['name'] == EXE_NAME:
-                        self.update_available.emit(latest_version_str, asset['browser_download_url'])
+                        self.signals.update_available.emit(latest_version_str, asset['browser_download_url'])
                         return
-                self.update_error.emit(f"Update found, but '{EXE_NAME}' is missing from the release assets.")
+                self.signals.update_error.emit(f"Update found, but '{EXE_NAME}' is missing from the release assets.")
             else:
-                self.up_to_date.emit("You are on the latest version.")
+                self.signals.up_to_date.emit("You are on the latest version.")
 
         except requests.exceptions.RequestException as e:
-            self.update_error.emit(f"Network error: {e}")
+            self.signals.update_error.emit(f"Network error: {e}")
         except Exception as e:
-            self.update_error.emit(f"An error occurred: {e}")
+            self.signals.update_error.emit(f"An error occurred: {e}")
 
 
-class UpdateDownloader(QThread):
+class UpdateDownloader(QRunnable):
     """
     Downloads the new executable and runs an updater script that kills the old process,
     replaces the file, and displays a message in the terminal.
+    Runs on the shared QThreadPool via start().
     """
-    download_finished = pyqtSignal()
-    download_error = pyqtSignal(str)
-
     def __init__(self, download_url, parent_app):
         super().__init__()
+        self.signals = UpdateDownloaderSignals()
         self.download_url = download_url
         self.parent_app = parent_app
 
+    def start(self):
+        """Queues the download on the application's shared thread pool."""
+        QThreadPool.globalInstance().start(self)
+
     def run(self):
         try:
             app_path = sys.executable
@@ -69,11 +138,20 @@ class UpdateDownloader(QThread):
             pid_file_path = os.path.join(app_dir, "updater.pid")
 
             # Download the new executable
-            with requests.get(self.download_url, stream=True, timeout=300) as r:
+            with requests.get(self.download_url, stream=True, timeout=(10, 300)) as r:
                 r.raise_for_status()
+                total_bytes = int(r.headers.get('Content-Length', 0) or 0)
+                downloaded_bytes = 0
+                last_emit_time = time.monotonic()
                 with open(temp_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
+                        downloaded_bytes += len(chunk)
+                        now = time.monotonic()
+                        if now - last_emit_time > PROGRESS_EMIT_INTERVAL:
+                            self.signals.download_progress.emit(downloaded_bytes, total_bytes)
+                            last_emit_time = now
+                self.signals.download_progress.emit(downloaded_bytes, total_bytes)
 
             # --- NEW: Write the current Process ID to the pid file ---
             with open(pid_file_path, "w") as f:
@@ -119,7 +197,7 @@ ENDLOCAL
             # --- Go back to the os.startfile command that we know works ---
             os.startfile(updater_script_path)
             
-            self.download_finished.emit()
+            self.signals.download_finished.emit()
 
         except Exception as e:
-            self.download_error.emit(f"Failed to download or run updater: {e}")
+            self.signals.download_error.emit(f"Failed to download or run updater: {e}")
@@ -13,7 +13,8 @@ def get_app_icon_object():
         QIcon: The application icon object.
     """
     global _app_icon_cache
-    if _app_icon_cache and not _app_icon_cache.isNull():
+    # A missing icon is cached as well, so later dialogs skip the filesystem lookups and warning
+    if _app_icon_cache is not None:
         return _app_icon_cache
 
     app_base_dir = ""
@@ -1,8 +1,8 @@
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-    QDialogButtonBox, QTextEdit
+    QDialogButtonBox, QTextEdit, QButtonGroup, QAbstractButton
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 
 class CustomFilenameDialog(QDialog):
     """A dialog for creating a custom filename format string."""
@@ -60,12 +60,16 @@ class CustomFilenameDialog(QDialog):
         keys_layout = QHBoxLayout()
         keys_layout.setSpacing(5)
         
+        # One group connection serves all key buttons; each button carries its internal key
+        self.key_button_group = QButtonGroup(self)
+        self.key_button_group.setExclusive(False)
         for display_key, internal_key in self.DISPLAY_KEY_MAP.items():
             key_button = QPushButton(f"{{{display_key}}}")
-            # Use a lambda to pass the correct internal key when the button is clicked
-            key_button.clicked.connect(lambda checked, key=internal_key: self.add_key_to_input(key))
+            key_button.setProperty("internal_key", internal_key)
+            self.key_button_group.addButton(key_button)
             keys_layout.addWidget(key_button)
         keys_layout.addStretch()
+        self.key_button_group.buttonClicked[QAbstractButton].connect(self._on_key_button_clicked)
 
         layout.addLayout(keys_layout)
         
@@ -75,11 +79,23 @@ class CustomFilenameDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    @pyqtSlot(QAbstractButton)
+    def _on_key_button_clicked(self, button):
+        """Inserts the placeholder for the clicked key button."""
+        self.add_key_to_input(button.property("internal_key"))
+
     def add_key_to_input(self, key_to_insert):
         """Adds the corresponding internal key placeholder to the input field."""
-        self.format_input.insert(f" {{{key_to_insert}}} ")
+        self._append_placeholders([key_to_insert])
         self.format_input.setFocus()
 
+    def _append_placeholders(self, keys):
+        """
+        Inserts placeholders for all given keys at the cursor (replacing any
+        selection) with a single insert, so a batch of keys is one edit and one undo step.
+        """
+        self.format_input.insert(''.join(f" {{{key}}} " for key in keys))
+
     def get_format_string(self):
         """Returns the final format string from the input field."""
         return self.format_input.text().strip()
@@ -1,7 +1,12 @@
+# --- Standard Library Imports ---
+import mmap
+import os
+import re
+
 # --- PyQt5 Imports ---
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QAbstractListModel, QModelIndex
 from PyQt5.QtWidgets import (
-    QApplication, QDialog, QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
+    QApplication, QDialog, QHBoxLayout, QLabel, QListView,
     QMessageBox, QPushButton, QVBoxLayout, QAbstractItemView, QFileDialog
 )
 
@@ -12,6 +17,117 @@ from ..assets import get_app_icon_object
 from .ExportOptionsDialog import ExportOptionsDialog
 from ...utils.resolution import get_dark_theme
 
+# Above this many entries the per-row list is replaced by a summary and "Retry All"
+ERROR_LIST_DISPLAY_LIMIT = 5000
+
+# Shared read-only fallback for error entries without 'file_info', so lookups don't allocate a new dict
+_NO_FILE_INFO = {}
+
+# Matches one line of an exported error file, scanned over the whole file at once.
+# Groups 1-4 capture the URL, title, ID, and filename of the detailed format;
+# group 5 captures the URL of the simple URL-only format (trailing text is ignored).
+_ERROR_LINE_RE = re.compile(
+    rb"(?m)^[^\S\n]*(?:"
+    rb"(https?://\S+)[^\S\n]*\[Post: '(.*?)' \(ID: (.*?)\), File: '(.*?)'\][^\S\n]*$"
+    rb"|(https?://\S+))"
+)
+
+class ErrorFilesModel(QAbstractListModel):
+    """
+    List model over its own copy of the error dictionaries, so downloads that keep
+    failing while the dialog is open can't change the rows behind the view's back.
+    New entries are only added through append_errors().
+
+    Row text is only built when the view asks for it, so only the visible rows
+    are ever formatted, and it is cached per row afterwards (including the resolved
+    creator name). Checked rows are tracked as a set of row indices, so collecting
+    them for a retry costs O(checked) rather than O(rows).
+    """
+
+    def __init__(self, error_files, parent_app, parent=None):
+        super().__init__(parent)
+        self.error_files = list(error_files)
+        self.parent_app = parent_app
+        self._checked_rows = set()
+        self._display_texts = [None] * len(error_files)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.error_files)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            text = self._display_texts[row]
+            if text is None:
+                text = self._display_texts[row] = self._format_error_text(self.error_files[row])
+            return text
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if row in self._checked_rows else Qt.Unchecked
+        if role == Qt.UserRole:
+            return self.error_files[row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        if value == Qt.Checked:
+            self._checked_rows.add(index.row())
+        else:
+            self._checked_rows.discard(index.row())
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def append_errors(self, new_errors):
+        """Appends a batch of error dictionaries in a single row insertion."""
+        if not new_errors:
+            return
+        first_row = len(self.error_files)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_errors) - 1)
+        self.error_files.extend(new_errors)
+        self._display_texts.extend([None] * len(new_errors))
+        self.endInsertRows()
+
+    def set_all_checked(self, checked):
+        """Sets every row's check state and notifies the view once."""
+        if not self.error_files:
+            return
+        self._checked_rows = set(range(len(self.error_files))) if checked else set()
+        self.dataChanged.emit(self.index(0), self.index(len(self.error_files) - 1), [Qt.CheckStateRole])
+
+    def checked_errors(self):
+        """Returns the error dictionaries of all checked rows, in list order."""
+        return [self.error_files[row] for row in sorted(self._checked_rows)]
+
+    def _format_error_text(self, error_info):
+        """Builds the two-line display text for one error entry (called lazily from data())."""
+        get = error_info.get
+        if get('is_loaded_from_txt'):
+            # New, smarter display for items loaded from a file
+            filename = get('file_info', _NO_FILE_INFO).get('name', 'Unknown Filename')
+            return f"File: {filename}\nPost: '{get('post_title', 'N/A')}' (ID: {get('original_post_id_for_log', 'N/A')}) [Loaded from .txt]"
+
+        # Original detailed format for errors that occurred during a session
+        if 'forced_filename_override' in error_info:
+            filename = error_info['forced_filename_override']
+        else:
+            filename = get('file_info', _NO_FILE_INFO).get('name', 'Unknown Filename')
+        creator_name = self._resolve_creator_name(get('service'), get('user_id'))
+        return f"File: {filename}\nCreator: {creator_name} - Post: '{get('post_title', 'Unknown Post')}' (ID: {get('original_post_id_for_log', 'N/A')})"
+
+    def _resolve_creator_name(self, service, user_id):
+        """Looks up a creator's display name in the main app's cache, falling back to the user ID."""
+        if service and user_id and hasattr(self.parent_app, 'creator_name_cache'):
+            return self.parent_app.creator_name_cache.get((service.lower(), str(user_id)), user_id)
+        return "Unknown Creator"
+
+
 class ErrorFilesDialog(QDialog):
     """
     Dialog to display files that were skipped due to errors and
@@ -35,7 +151,7 @@ class ErrorFilesDialog(QDialog):
         super().__init__(parent)
         self.parent_app = parent_app
         self.setModal(True)
-        self.error_files = error_files_info_list
+        self._loaded_errors = []  # Entries loaded from .txt, written back to the main window in done()
 
         # --- Basic Window Setup ---
         app_icon = get_app_icon_object()
@@ -48,11 +164,11 @@ class ErrorFilesDialog(QDialog):
         self.setMinimumSize(int(base_width * scale_factor), int(base_height * scale_factor))
         self.resize(int(base_width * scale_factor * 1.1), int(base_height * scale_factor * 1.1))
 
-        self._init_ui()
+        self._init_ui(error_files_info_list)
         self._retranslate_ui()
         self._apply_theme()
 
-    def _init_ui(self):
+    def _init_ui(self, error_files_info_list):
         """Initializes all UI components and layouts for the dialog."""
         main_layout = QVBoxLayout(self)
 
@@ -60,11 +176,21 @@ class ErrorFilesDialog(QDialog):
         self.info_label.setWordWrap(True)
         main_layout.addWidget(self.info_label)
 
-        self.files_list_widget = QListWidget()
-        self.files_list_widget.setSelectionMode(QAbstractItemView.NoSelection)
-        main_layout.addWidget(self.files_list_widget)
-        
-        self._populate_list() # Populate with initial errors from constructor
+        # Model/view instead of a widget per row keeps large error lists responsive
+        self.files_model = ErrorFilesModel(error_files_info_list, self.parent_app, self)
+        self.error_files = self.files_model.error_files
+        self.files_list_view = QListView()
+        self.files_list_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.files_list_view.setUniformItemSizes(True)
+        self.files_list_view.setModel(self.files_model)
+        main_layout.addWidget(self.files_list_view)
+
+        # Shown in place of the list when there are too many entries to browse
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        self.summary_label.setAlignment(Qt.AlignCenter)
+        self.summary_label.hide()
+        main_layout.addWidget(self.summary_label, 1)
 
         # --- Control Buttons ---
         buttons_layout = QHBoxLayout()
@@ -97,16 +223,27 @@ class ErrorFilesDialog(QDialog):
         self.retry_button.setEnabled(has_errors)
         self.export_button.setEnabled(has_errors)
 
-    def _populate_list(self):
-        """Populates the list widget with details of the failed files."""
-        self.files_list_widget.clear()
-        for error_info in self.error_files:
-            self._add_item_to_list(error_info)
+    def _is_list_hidden(self):
+        """Returns True when the entry count is too large to show row by row."""
+        return len(self.error_files) > ERROR_LIST_DISPLAY_LIMIT
+
+    def _update_list_visibility(self):
+        """Swaps between the per-row list and the summary label based on the entry count."""
+        list_hidden = self._is_list_hidden()
+        self.files_list_view.setVisible(not list_hidden)
+        self.summary_label.setVisible(list_hidden)
+        self.select_all_button.setVisible(not list_hidden)
+        if list_hidden:
+            self.summary_label.setText(self._tr(
+                "error_files_list_hidden_label",
+                "{count} errors loaded — list hidden for performance. Use Retry All / Export."
+            ).format(count=len(self.error_files)))
+            self.retry_button.setText(self._tr("error_files_retry_all_button", "Retry All"))
+        else:
+            self.retry_button.setText(self._tr("error_files_retry_selected_button", "Retry Selected"))
 
     def _handle_load_errors_from_txt(self):
         """Opens a file dialog to load URLs from a .txt file."""
-        import re
-        
         filepath, _ = QFileDialog.getOpenFileName(
             self,
             self._tr("error_files_load_dialog_title", "Load Error File URLs"),
@@ -118,49 +255,51 @@ class ErrorFilesDialog(QDialog):
             return
 
         try:
-            # Regex for the detailed format, capturing the URL, title, ID, and filename
-            detailed_pattern = re.compile(r"^(https?://[^\s]+)\s*\[Post: '(.*?)' \(ID: (.*?)\), File: '(.*?)'\]$")
-            # Regex for the simple URL-only format
-            simple_pattern = re.compile(r'^(https?://[^\s]+)')
-
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    url, post_title, post_id, filename = None, 'Loaded from .txt', 'N/A', None
-                    
-                    # First, try to match the detailed format
-                    detailed_match = detailed_pattern.match(line)
-                    if detailed_match:
-                        url, post_title, post_id, filename = detailed_match.groups()
-                    else:
-                        # If it fails, fall back to the simple URL format
-                        simple_match = simple_pattern.match(line)
-                        if simple_match:
-                            url = simple_match.group(1)
-                            filename = url.split('/')[-1] # Best-effort filename from URL
-
-                    if url:
+            new_errors = []
+            add_error = new_errors.append
+            # Fields that are identical for every loaded entry are built once and copied per row
+            error_template = {
+                'is_loaded_from_txt': True,
+                'target_folder_path': self.parent_app.dir_input.text().strip(),
+                'file_index_in_post': 0,
+                'num_files_in_this_post': 1,
+                'service': None,
+                'user_id': None,
+                'api_url_input': ''
+            }
+            if os.path.getsize(filepath) > 0:  # mmap cannot map an empty file
+                with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+                    # One regex pass over the whole file; only the captured groups are decoded
+                    for match in _ERROR_LINE_RE.finditer(file_map):
+                        url_bytes, title_bytes, post_id_bytes, filename_bytes, simple_url_bytes = match.groups()
+                        if url_bytes is not None:
+                            url = url_bytes.decode('utf-8')
+                            post_title = title_bytes.decode('utf-8')
+                            post_id = post_id_bytes.decode('utf-8')
+                            filename = filename_bytes.decode('utf-8')
+                        else:
+                            url = simple_url_bytes.decode('utf-8')
+                            post_title, post_id = 'Loaded from .txt', 'N/A'
+                            filename = url.rpartition('/')[2] or url # Best-effort filename from URL
+
                         # Create the error object with the parsed (or default) data
-                        simple_error_info = {
-                            'is_loaded_from_txt': True,
-                            'file_info': {'url': url, 'name': filename},
-                            'post_title': post_title,
-                            'original_post_id_for_log': post_id,
-                            'target_folder_path': self.parent_app.dir_input.text().strip(),
-                            'forced_filename_override': filename,
-                            'file_index_in_post': 0,
-                            'num_files_in_this_post': 1,
-                            'service': None,
-                            'user_id': None,
-                            'api_url_input': ''
-                        }
-                        self.error_files.append(simple_error_info)
-                        self._add_item_to_list(simple_error_info)
-            
+                        simple_error_info = error_template.copy()
+                        simple_error_info['file_info'] = {'url': url, 'name': filename}
+                        simple_error_info['post_title'] = post_title
+                        simple_error_info['original_post_id_for_log'] = post_id
+                        simple_error_info['forced_filename_override'] = filename
+                        add_error(simple_error_info)
+
+            # Insert everything in one batch and repaint the view only once afterwards
+            self.files_list_view.setUpdatesEnabled(False)
+            try:
+                self.files_model.append_errors(new_errors)
+            finally:
+                self.files_list_view.setUpdatesEnabled(True)
+            self._loaded_errors.extend(new_errors)
+
             self.info_label.setText(self._tr("error_files_found_label", "The following {count} file(s)...").format(count=len(self.error_files)))
+            self._update_list_visibility()
             
             has_errors = bool(self.error_files)
             self.select_all_button.setEnabled(has_errors)
@@ -189,7 +328,7 @@ class ErrorFilesDialog(QDialog):
             self.info_label.setText(self._tr("error_files_found_label", "The following {count} file(s)...").format(count=len(self.error_files)))
 
         self.select_all_button.setText(self._tr("error_files_select_all_button", "Select All"))
-        self.retry_button.setText(self._tr("error_files_retry_selected_button", "Retry Selected"))
+        self._update_list_visibility()
         self.load_button.setText(self._tr("error_files_load_urls_button", "Load URLs from .txt"))       
         self.export_button.setText(self._tr("error_files_export_urls_button", "Export URLs to .txt"))
         self.ok_button.setText(self._tr("ok_button", "OK"))
@@ -205,52 +344,34 @@ class ErrorFilesDialog(QDialog):
             # Explicitly set a blank stylesheet for light mode
             self.setStyleSheet("")
 
-    def _add_item_to_list(self, error_info):
-        """Creates and adds a single QListWidgetItem based on error_info content."""
-        if error_info.get('is_loaded_from_txt'):
-            # New, smarter display for items loaded from a file
-            filename = error_info.get('file_info', {}).get('name', 'Unknown Filename')
-            post_title = error_info.get('post_title', 'N/A')
-            post_id = error_info.get('original_post_id_for_log', 'N/A')
-            item_text = f"File: {filename}\nPost: '{post_title}' (ID: {post_id}) [Loaded from .txt]"
-        else:
-            # Original detailed format for errors that occurred during a session
-            filename = error_info.get('forced_filename_override',
-                                      error_info.get('file_info', {}).get('name', 'Unknown Filename'))
-            post_title = error_info.get('post_title', 'Unknown Post')
-            post_id = error_info.get('original_post_id_for_log', 'N/A')
-            creator_name = "Unknown Creator"
-            service = error_info.get('service')
-            user_id = error_info.get('user_id')
-            if service and user_id and hasattr(self.parent_app, 'creator_name_cache'):
-                creator_key = (service.lower(), str(user_id))
-                creator_name = self.parent_app.creator_name_cache.get(creator_key, user_id)
-            item_text = f"File: {filename}\nCreator: {creator_name} - Post: '{post_title}' (ID: {post_id})"
-
-        list_item = QListWidgetItem(item_text)
-        list_item.setData(Qt.UserRole, error_info)
-        list_item.setFlags(list_item.flags() | Qt.ItemIsUserCheckable)
-        list_item.setCheckState(Qt.Unchecked)
-        self.files_list_widget.addItem(list_item)
+    def _commit_loaded_errors(self):
+        """Adds the entries loaded from .txt to the main window's error list (once)."""
+        if not self._loaded_errors or not self.parent_app:
+            return
+        self.parent_app.permanently_failed_files_for_dialog.extend(self._loaded_errors)
+        self._loaded_errors = []
+        if hasattr(self.parent_app, '_update_error_button_count'):
+            self.parent_app._update_error_button_count()
+
+    def done(self, result):
+        """Writes loaded entries back when the dialog closes, however it is closed."""
+        self._commit_loaded_errors()
+        super().done(result)
 
     def _select_all_items(self):
         """Checks all items in the list."""
-        if hasattr(self, 'files_list_widget'):
-            for i in range(self.files_list_widget.count()):
-                self.files_list_widget.item(i).setCheckState(Qt.Checked)
+        self.files_model.set_all_checked(True)
 
     def _handle_retry_selected(self):
-        """Gathers selected files and emits the retry signal."""
-        if not hasattr(self, 'files_list_widget'):
-            return
-
-        selected_files_for_retry = [
-            self.files_list_widget.item(i).data(Qt.UserRole)
-            for i in range(self.files_list_widget.count())
-            if self.files_list_widget.item(i).checkState() == Qt.Checked
-        ]
+        """Gathers selected files (or all of them when the list is hidden) and emits the retry signal."""
+        if self._is_list_hidden():
+            selected_files_for_retry = list(self.error_files)
+        else:
+            selected_files_for_retry = self.files_model.checked_errors()
 
         if selected_files_for_retry:
+            # Loaded entries must be in the main list before the retry session filters it
+            self._commit_loaded_errors()
             self.retry_selected_signal.emit(selected_files_for_retry)
             self.accept()
         else:
@@ -277,8 +398,9 @@ class ErrorFilesDialog(QDialog):
         export_option = options_dialog.get_selected_option()
 
         lines_to_export = []
+        add_line = lines_to_export.append
         for error_item in self.error_files:
-            file_info = error_item.get('file_info', {})
+            file_info = error_item.get('file_info', _NO_FILE_INFO)
             url = file_info.get('url')
 
             if url:
@@ -289,10 +411,9 @@ class ErrorFilesDialog(QDialog):
                     # Prioritize the final renamed filename, but fall back to the original from the API
                     filename_to_display = error_item.get('forced_filename_override') or file_info.get('name', 'Unknown Filename')
                     
-                    details_string = f" [Post: '{post_title}' (ID: {post_id}), File: '{filename_to_display}']"
-                    lines_to_export.append(f"{url}{details_string}")
+                    add_line(f"{url} [Post: '{post_title}' (ID: {post_id}), File: '{filename_to_display}']")
                 else:
-                    lines_to_export.append(url)
+                    add_line(url)
 
         if not lines_to_export:
             QMessageBox.information(
@@ -312,9 +433,9 @@ class ErrorFilesDialog(QDialog):
 
         if filepath:
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    for line in lines_to_export:
-                        f.write(f"{line}\n")
+                with open(filepath, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                    f.write("\n".join(lines_to_export))
+                    f.write("\n")
                 QMessageBox.information(
                     self,
                     self._tr("error_files_export_success_title", "Export Successful"),
@@ -1,15 +1,54 @@
 import os
 import json
-import re
+import string
 from collections import defaultdict
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QLabel, QLineEdit, QTextEdit, QPushButton,
-    QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QListWidget, QRadioButton,
-    QButtonGroup, QCheckBox, QSplitter, QGroupBox, QDialog, QStackedWidget,
-    QScrollArea, QListWidgetItem, QSizePolicy, QProgressBar, QAbstractItemView, QFrame,
-    QMainWindow, QAction, QGridLayout, 
+    QWidget, QLabel, QLineEdit, QTextEdit, QPushButton, QVBoxLayout, QHBoxLayout,
+    QFileDialog, QMessageBox, QRadioButton, QButtonGroup, QCheckBox, QGroupBox, QDialog
 )
-from PyQt5.QtCore import Qt
+
+EXPORT_WRITE_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+# Placeholders supported by the custom export template, in the order their values are passed
+CUSTOM_TEMPLATE_FIELDS = ('url', 'post_title', 'link_text', 'platform', 'key')
+_CONVERTERS = {'s': str, 'r': repr, 'a': ascii}
+# Maps spaces and characters that are invalid in filenames to '_' for per-platform export files
+_PLATFORM_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?* '})
+
+
+def _compile_custom_template(template):
+    """
+    Parses a custom export template once into (literal, field_index, conversion, format_spec)
+    pieces, so each row can be rendered without re-parsing the format string.
+
+    Returns None if the template uses anything beyond the plain named placeholders
+    (e.g. attribute/index access or nested specs); callers then fall back to str.format.
+    Raises ValueError for malformed templates and unknown conversions, like str.format.
+    """
+    pieces = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is None:
+            pieces.append((literal, None, None, ''))
+            continue
+        if conversion and conversion not in _CONVERTERS:
+            raise ValueError(f"Unknown conversion specifier {conversion}")
+        if field_name not in CUSTOM_TEMPLATE_FIELDS or '{' in format_spec:
+            return None
+        pieces.append((literal, CUSTOM_TEMPLATE_FIELDS.index(field_name), _CONVERTERS.get(conversion), format_spec))
+    return pieces
+
+
+def _render_custom_template(pieces, values):
+    """Renders a compiled template for one row; 'values' follows CUSTOM_TEMPLATE_FIELDS order."""
+    parts = []
+    for literal, field_index, converter, format_spec in pieces:
+        parts.append(literal)
+        if field_index is not None:
+            value = values[field_index]
+            if converter:
+                value = converter(value)
+            parts.append(format(value, format_spec))
+    return ''.join(parts)
 
 class ExportLinksDialog(QDialog):
     """
@@ -162,65 +201,105 @@ class ExportLinksDialog(QDialog):
 
     def _write_txt_file(self, base_filepath):
         if self.check_separate_files.isChecked():
-            links_by_platform = defaultdict(list)
-            for _, _, link_url, platform, _ in self.links_data:
-                sanitized_platform = re.sub(r'[<>:"/\\|?*]', '_', platform.lower().replace(' ', '_'))
-                links_by_platform[sanitized_platform].append(link_url)
-            
             base, ext = os.path.splitext(base_filepath)
             if not ext: ext = ".txt"
 
+            first_platform = self.links_data[0][3] if self.links_data else None
+            if all(row[3] == first_platform for row in self.links_data):
+                # Single platform (the common case): no grouping pass needed
+                links_by_platform = {}
+                if self.links_data:
+                    sanitized_platform = first_platform.lower().translate(_PLATFORM_FILENAME_TRANS)
+                    links_by_platform[sanitized_platform] = [row[2] for row in self.links_data]
+            else:
+                links_by_platform = defaultdict(list)
+                for _, _, link_url, platform, _ in self.links_data:
+                    sanitized_platform = platform.lower().translate(_PLATFORM_FILENAME_TRANS)
+                    links_by_platform[sanitized_platform].append(link_url)
+
             for platform_key, links in links_by_platform.items():
                 platform_filepath = f"{base}_{platform_key}{ext}"
-                with open(platform_filepath, 'w', encoding='utf-8') as f:
-                    for url in links:
-                        f.write(url + "\n")
+                with open(platform_filepath, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER_SIZE) as f:
+                    f.write("\n".join(links) + "\n")
             return
 
-        with open(base_filepath, 'w', encoding='utf-8') as f:
+        with open(base_filepath, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER_SIZE) as f:
             if self.radio_simple.isChecked():
-                for _, _, link_url, _, _ in self.links_data:
-                    f.write(link_url + "\n")
+                f.writelines(f"{link_url}\n" for _, _, link_url, _, _ in self.links_data)
 
             elif self.radio_detailed.isChecked():
                 include_titles = self.check_include_titles.isChecked()
                 include_text = self.check_include_link_text.isChecked()
                 include_platform = self.check_include_platform.isChecked()
-                current_title = None
-                for post_title, link_text, link_url, platform, _ in self.links_data:
-                    if include_titles and post_title != current_title:
-                        if current_title is not None: f.write("\n" + "="*60 + "\n\n")
-                        f.write(f"# Post: {post_title}\n")
-                        current_title = post_title
+
+                def format_line(link_text, link_url, platform):
                     line_parts = [link_url]
                     if include_platform: line_parts.append(f"Platform: {platform}")
                     if include_text and link_text: line_parts.append(f"Description: {link_text}")
-                    f.write(" | ".join(line_parts) + "\n")
+                    return " | ".join(line_parts) + "\n"
+
+                out = []
+                add_line = out.append
+                if include_titles:
+                    # Bucket rows by post title (first-seen order) so every post gets exactly
+                    # one header, even if its links are not adjacent in links_data.
+                    rows_by_title = {}
+                    for row in self.links_data:
+                        rows_by_title.setdefault(row[0], []).append(row)
+                    for group_index, (post_title, rows) in enumerate(rows_by_title.items()):
+                        if group_index: add_line("\n" + "="*60 + "\n\n")
+                        add_line(f"# Post: {post_title}\n")
+                        for _, link_text, link_url, platform, _ in rows:
+                            add_line(format_line(link_text, link_url, platform))
+                else:
+                    for _, link_text, link_url, platform, _ in self.links_data:
+                        add_line(format_line(link_text, link_url, platform))
+                f.write("".join(out))
             
             elif self.radio_custom.isChecked():
                 template = self.custom_format_input.toPlainText().replace("\\n", "\n")
+                line_ending = "" if template.endswith('\n') else "\n"
+                out = []
+                add_line = out.append
+                # Compiled on the first row, so (like str.format) a bad template only errors if used
+                compiled_template = None
+                is_template_compiled = False
                 for post_title, link_text, link_url, platform, decryption_key in self.links_data:
-                    formatted_line = template.format(
-                        url=link_url,
-                        post_title=post_title,
-                        link_text=link_text,
-                        platform=platform,
-                        key=decryption_key or ""
-                    )
-                    f.write(formatted_line)
-                    if not template.endswith('\n'):
-                        f.write('\n')
+                    if not is_template_compiled:
+                        compiled_template = _compile_custom_template(template)
+                        is_template_compiled = True
+                    if compiled_template is not None:
+                        formatted_line = _render_custom_template(
+                            compiled_template, (link_url, post_title, link_text, platform, decryption_key or "")
+                        )
+                    else:
+                        formatted_line = template.format(
+                            url=link_url,
+                            post_title=post_title,
+                            link_text=link_text,
+                            platform=platform,
+                            key=decryption_key or ""
+                        )
+                    add_line(formatted_line + line_ending)
+                f.write("".join(out))
 
     def _write_json_file(self, filepath):
-        output_data = []
-        for post_title, link_text, link_url, platform, decryption_key in self.links_data:
-            output_data.append({
-                "post_title": post_title,
-                "url": link_url,
-                "link_text": link_text,
-                "platform": platform,
-                "key": decryption_key or None
-            })
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
\ No newline at end of file
+        # Stream one object at a time instead of building the whole list first.
+        # The layout matches json.dump(..., indent=2) of the full list.
+        with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER_SIZE) as f:
+            if not self.links_data:
+                f.write("[]")
+                return
+            f.write("[\n")
+            for index, (post_title, link_text, link_url, platform, decryption_key) in enumerate(self.links_data):
+                item_json = json.dumps({
+                    "post_title": post_title,
+                    "url": link_url,
+                    "link_text": link_text,
+                    "platform": platform,
+                    "key": decryption_key or None
+                }, indent=2, ensure_ascii=False)
+                if index:
+                    f.write(",\n")
+                f.write("  " + item_json.replace("\n", "\n  "))
+            f.write("\n]")
\ No newline at end of file
@@ -2,19 +2,17 @@
 import os
 import json
 import sys
+import time
 
 # --- PyQt5 Imports ---
-from PyQt5.QtCore import Qt, QStandardPaths, QTimer
+from PyQt5.QtCore import Qt, QStandardPaths, QTimer, QSignalBlocker
 from PyQt5.QtWidgets import (
     QApplication, QDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout,
-    QGroupBox, QComboBox, QMessageBox, QGridLayout, QCheckBox, QLineEdit
+    QGroupBox, QComboBox, QMessageBox, QGridLayout, QCheckBox, QLineEdit, QWidget
 )
 # --- Local Application Imports ---
-from ...i18n.translator import get_translation
-from ...utils.resolution import get_dark_theme
+from ...i18n.translator import get_translation, get_translation_table
 from ..assets import get_app_icon_object
-
-from ..main_window import get_app_icon_object
 from ...config.constants import (
     THEME_KEY, LANGUAGE_KEY, DOWNLOAD_LOCATION_KEY,
     RESOLUTION_KEY, UI_SCALE_KEY, SAVE_CREATOR_JSON_KEY,
@@ -22,7 +20,22 @@ from ...config.constants import (
     COOKIE_TEXT_KEY, USE_COOKIE_KEY,
     FETCH_FIRST_KEY, DISCORD_TOKEN_KEY, POST_DOWNLOAD_ACTION_KEY
 )
-from ...services.updater import UpdateChecker, UpdateDownloader
+
+SETTINGS_SAVE_DELAY_MS = 300 # Typing pause before a text setting is written to disk
+COMBO_CHANGE_DELAY_MS = 400 # Pause after the last combo box change before it is applied
+
+# Fixed (display text, setting value) choices for the settings combo boxes
+_RESOLUTIONS = (("Auto", "Auto"), ("1280x720", "1280x720"), ("1600x900", "1600x900"), ("1920x1080", "1920x1080"))
+_SCALES = (
+    ("50%", 0.5), ("70%", 0.7), ("90%", 0.9), ("100% (Default)", 1.0),
+    ("125%", 1.25), ("150%", 1.50), ("175%", 1.75), ("200%", 2.0)
+)
+_LANGUAGES = (
+    ("English", "en"), ("日本語 (Japanese)", "ja"), ("Français (French)", "fr"),
+    ("Deutsch (German)", "de"), ("Español (Spanish)", "es"), ("Português (Portuguese)", "pt"),
+    ("Русский (Russian)", "ru"), ("简体中文 (Simplified Chinese)", "zh_CN"),
+    ("繁體中文 (Traditional Chinese)", "zh_TW"), ("한국어 (Korean)", "ko")
+)
 
 class CountdownMessageBox(QDialog):
     """
@@ -33,6 +46,8 @@ class CountdownMessageBox(QDialog):
         super().__init__(parent)
         self.parent_app = parent_app
         self.countdown = countdown_seconds
+        self._countdown_total = countdown_seconds
+        self._countdown_start = time.monotonic()
         
         # --- Basic Window Setup ---
         self.setWindowTitle(title)
@@ -42,13 +57,13 @@ class CountdownMessageBox(QDialog):
             self.setWindowIcon(app_icon)
         
         self._init_ui(text)
-        self._apply_theme()
         
         # --- Timer Setup ---
+        # Each tick is rescheduled against the start time, so delays in the event loop don't add up
         self.timer = QTimer(self)
-        self.timer.setInterval(1000) # Tick every second
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self._update_countdown)
-        self.timer.start()
+        self._update_countdown() # Initial text setup
 
     def _init_ui(self, text):
         """Initializes the UI components of the dialog."""
@@ -76,7 +91,6 @@ class CountdownMessageBox(QDialog):
         main_layout.addLayout(buttons_layout)
         
         self._retranslate_ui()
-        self._update_countdown() # Initial text setup
 
     def _tr(self, key, default_text=""):
         """Helper for translations."""
@@ -87,26 +101,21 @@ class CountdownMessageBox(QDialog):
     def _retranslate_ui(self):
         """Sets translated text for UI elements."""
         self.no_button.setText(self._tr("no_button_text", "No"))
-        # The 'yes' button text is handled by the countdown
+        # The 'yes' button text is handled by the countdown, which only fills in the seconds
+        self._yes_template = self._tr("yes_button_text", "Yes") + " (%d)"
         
     def _update_countdown(self):
-        """Updates the countdown and button text each second."""
+        """Updates the button text from the elapsed wall time and schedules the next tick."""
+        elapsed = time.monotonic() - self._countdown_start
+        self.countdown = self._countdown_total - int(elapsed)
         if self.countdown <= 0:
             self.timer.stop()
             self.accept() # Automatically accept when countdown finishes
             return
             
-        yes_text = self._tr("yes_button_text", "Yes")
-        self.yes_button.setText(f"{yes_text} ({self.countdown})")
-        self.countdown -= 1
-
-    def _apply_theme(self):
-        """Applies the current theme from the parent application."""
-        if self.parent_app and hasattr(self.parent_app, 'current_theme') and self.parent_app.current_theme == "dark":
-            scale = getattr(self.parent_app, 'scale_factor', 1)
-            self.setStyleSheet(get_dark_theme(scale))
-        else:
-            self.setStyleSheet("")
+        self.yes_button.setText(self._yes_template % self.countdown)
+        # Fire again on the next whole second since the start
+        self.timer.start(1000 - int(elapsed * 1000) % 1000)
 
 class FutureSettingsDialog(QDialog):
     """
@@ -118,6 +127,14 @@ class FutureSettingsDialog(QDialog):
         self.parent_app = parent_app_ref
         self.setModal(True)
         self.update_downloader_thread = None # To keep a reference
+        self._pending_date_prefix = None
+        self._current_version = self.parent_app.windowTitle().rsplit(' v', 1)[-1]
+
+        # Debounces text-setting writes so typing doesn't hit the disk on every keystroke
+        self._save_timer = self._create_debounce_timer(SETTINGS_SAVE_DELAY_MS, self._flush_date_prefix_format)
+        # Arrow-key scrolling through a combo box only applies the entry it stops on
+        self._display_change_timer = self._create_debounce_timer(COMBO_CHANGE_DELAY_MS, self._apply_display_setting)
+        self._language_change_timer = self._create_debounce_timer(COMBO_CHANGE_DELAY_MS, self._apply_language_selection)
 
         app_icon = get_app_icon_object()
         if app_icon and not app_icon.isNull():
@@ -130,9 +147,10 @@ class FutureSettingsDialog(QDialog):
         scaled_min_h = int(base_min_h * scale_factor)
         self.setMinimumSize(scaled_min_w, scaled_min_h)
 
+        self._load_settings_snapshot()
         self._init_ui()
         self._retranslate_ui()
-        self._apply_theme()
+        self._load_setting_values()
 
     def _init_ui(self):
         """Initializes all UI components and layouts for the dialog."""
@@ -198,15 +216,18 @@ class FutureSettingsDialog(QDialog):
 
         main_layout.addWidget(self.download_window_group_box)
 
+        self.restart_required_label = QLabel()
+        self.restart_required_label.setWordWrap(True)
+        self.restart_required_label.hide()
+        main_layout.addWidget(self.restart_required_label)
+
+        # The update section starts collapsed; its widgets are built the first time it is expanded
         self.update_group_box = QGroupBox()
-        update_layout = QGridLayout(self.update_group_box)
-        self.version_label = QLabel()
-        self.update_status_label = QLabel()
-        self.check_update_button = QPushButton()
-        self.check_update_button.clicked.connect(self._check_for_updates)
-        update_layout.addWidget(self.version_label, 0, 0)
-        update_layout.addWidget(self.update_status_label, 0, 1)
-        update_layout.addWidget(self.check_update_button, 1, 0, 1, 2)
+        self.update_group_box.setCheckable(True)
+        self.update_group_box.setChecked(False)
+        self.update_group_box.toggled.connect(self._on_update_group_toggled)
+        QVBoxLayout(self.update_group_box)
+        self.update_contents_widget = None
         main_layout.addWidget(self.update_group_box)
 
         main_layout.addStretch(1)
@@ -216,121 +237,184 @@ class FutureSettingsDialog(QDialog):
         main_layout.addWidget(self.ok_button, 0, Qt.AlignRight | Qt.AlignBottom)
 
     def _retranslate_ui(self):
-        self.setWindowTitle(self._tr("settings_dialog_title", "Settings"))
-        self.interface_group_box.setTitle(self._tr("interface_group_title", "Interface Settings"))
-        self.download_window_group_box.setTitle(self._tr("download_window_group_title", "Download & Window Settings"))
-        self.theme_label.setText(self._tr("theme_label", "Theme:"))
-        self.ui_scale_label.setText(self._tr("ui_scale_label", "UI Scale:"))
-        self.language_label.setText(self._tr("language_label", "Language:"))
-
-        self.window_size_label.setText(self._tr("window_size_label", "Window Size:"))
-        self.default_path_label.setText(self._tr("default_path_label", "Default Path:"))
-
-        self.date_prefix_format_label.setText(self._tr("date_prefix_format_label", "Post Subfolder Format:"))
+        # One table lookup per key instead of a get_translation call each
+        tr = self._translation_table().get
+        self.setWindowTitle(tr("settings_dialog_title", "Settings"))
+        self.interface_group_box.setTitle(tr("interface_group_title", "Interface Settings"))
+        self.download_window_group_box.setTitle(tr("download_window_group_title", "Download & Window Settings"))
+        self.theme_label.setText(tr("theme_label", "Theme:"))
+        self.ui_scale_label.setText(tr("ui_scale_label", "UI Scale:"))
+        self.language_label.setText(tr("language_label", "Language:"))
+
+        self.window_size_label.setText(tr("window_size_label", "Window Size:"))
+        self.default_path_label.setText(tr("default_path_label", "Default Path:"))
+
+        self.date_prefix_format_label.setText(tr("date_prefix_format_label", "Post Subfolder Format:"))
         # Update placeholder to include {post}
-        self.date_prefix_format_input.setPlaceholderText(self._tr("date_prefix_format_placeholder", "e.g., YYYY-MM-DD {post}"))
+        self.date_prefix_format_input.setPlaceholderText(tr("date_prefix_format_placeholder", "e.g., YYYY-MM-DD {post}"))
         # Add the tooltip to explain usage
-        self.date_prefix_format_input.setToolTip(self._tr(
+        self.date_prefix_format_input.setToolTip(tr(
             "date_prefix_format_tooltip", 
             "Use YYYY, MM, DD for the date and {post} for the post title to create a custom folder name.\n\n"
             "Example 1: YYYY-MM-DD {post}\n"
             "Example 2: {post} [YYYYMMDD]"
         ))
         
-        self.post_download_action_label.setText(self._tr("post_download_action_label", "Action After Download:"))
-
-        self.post_download_action_label.setText(self._tr("post_download_action_label", "Action After Download:"))
-        self.save_creator_json_checkbox.setText(self._tr("save_creator_json_label", "Save Creator.json file"))
-        self.fetch_first_checkbox.setText(self._tr("fetch_first_label", "Fetch First (Download after all pages are found)"))
-        self.fetch_first_checkbox.setToolTip(self._tr("fetch_first_tooltip", "If checked, the downloader will find all posts from a creator first before starting any downloads.\nThis can be slower to start but provides a more accurate progress bar."))
+        self.post_download_action_label.setText(tr("post_download_action_label", "Action After Download:"))
+        self.save_creator_json_checkbox.setText(tr("save_creator_json_label", "Save Creator.json file"))
+        self.fetch_first_checkbox.setText(tr("fetch_first_label", "Fetch First (Download after all pages are found)"))
+        self.fetch_first_checkbox.setToolTip(tr("fetch_first_tooltip", "If checked, the downloader will find all posts from a creator first before starting any downloads.\nThis can be slower to start but provides a more accurate progress bar."))
         self._update_theme_toggle_button_text()
-        self.save_path_button.setText(self._tr("settings_save_all_button", "Save Path + Cookie + Token"))
-        self.save_path_button.setToolTip(self._tr("settings_save_all_tooltip", "Save the current 'Download Location', Cookie, and Discord Token settings for future sessions."))
-        self.ok_button.setText(self._tr("ok_button", "OK"))
+        self.save_path_button.setText(tr("settings_save_all_button", "Save Path + Cookie + Token"))
+        self.save_path_button.setToolTip(tr("settings_save_all_tooltip", "Save the current 'Download Location', Cookie, and Discord Token settings for future sessions."))
+        self.ok_button.setText(tr("ok_button", "OK"))
 
-        self.update_group_box.setTitle(self._tr("update_group_title", "Application Updates"))
-        current_version = self.parent_app.windowTitle().split(' v')[-1]
-        self.version_label.setText(self._tr("current_version_label", f"Current Version: v{current_version}"))
-        self.update_status_label.setText(self._tr("update_status_ready", "Ready to check."))
-        self.check_update_button.setText(self._tr("check_for_updates_button", "Check for Updates"))
-        
+        self.update_group_box.setTitle(tr("update_group_title", "Application Updates"))
+        if self.update_contents_widget is not None:
+            self._retranslate_update_group()
+
+        # The action names are translated; the other setting widgets don't depend on the language
+        self._populate_post_download_action_combo()
+
+    def _load_setting_values(self):
+        """Fills the widgets whose contents don't change with the language; done once on open."""
         self._populate_display_combo_boxes()
         self._populate_language_combo_box()
-        self._populate_post_download_action_combo()
         self._load_date_prefix_format()
         self._load_checkbox_states()
 
+    def _retranslate_update_group(self):
+        self.version_label.setText(self._tr("current_version_label", "Current Version: v{version}", version=self._current_version))
+        self.update_status_label.setText(self._tr("update_status_ready", "Ready to check."))
+        self.check_update_button.setText(self._tr("check_for_updates_button", "Check for Updates"))
+
+    def _on_update_group_toggled(self, expanded):
+        """Builds the update widgets on first expansion and shows or hides them."""
+        if expanded and self.update_contents_widget is None:
+            self._build_update_group()
+        if self.update_contents_widget is not None:
+            self.update_contents_widget.setVisible(expanded)
+
+    def _build_update_group(self):
+        """Creates the update section widgets and starts fetching the latest release."""
+        from ...services.updater import prefetch_latest_release
+
+        self.update_contents_widget = QWidget()
+        update_layout = QGridLayout(self.update_contents_widget)
+        update_layout.setContentsMargins(0, 0, 0, 0)
+        self.version_label = QLabel()
+        self.update_status_label = QLabel()
+        self.check_update_button = QPushButton()
+        self.check_update_button.clicked.connect(self._check_for_updates)
+        update_layout.addWidget(self.version_label, 0, 0)
+        update_layout.addWidget(self.update_status_label, 0, 1)
+        update_layout.addWidget(self.check_update_button, 1, 0, 1, 2)
+        self.update_group_box.layout().addWidget(self.update_contents_widget)
+        self._retranslate_update_group()
+
+        prefetch_latest_release() # Warm up the update check while the user reads the section
+
     def _check_for_updates(self):
+        from ...services.updater import UpdateChecker
+
         self.check_update_button.setEnabled(False)
         self.update_status_label.setText(self._tr("update_status_checking", "Checking..."))
-        current_version = self.parent_app.windowTitle().split(' v')[-1]
-        
-        self.update_checker_thread = UpdateChecker(current_version)
-        self.update_checker_thread.update_available.connect(self._on_update_available)
-        self.update_checker_thread.up_to_date.connect(self._on_up_to_date)
-        self.update_checker_thread.update_error.connect(self._on_update_error)
+
+        self.update_checker_thread = UpdateChecker(self._current_version)
+        self.update_checker_thread.signals.update_available.connect(self._on_update_available)
+        self.update_checker_thread.signals.up_to_date.connect(self._on_up_to_date)
+        self.update_checker_thread.signals.update_error.connect(self._on_update_error)
         self.update_checker_thread.start()
 
     def _on_update_available(self, new_version, download_url):
-        self.update_status_label.setText(self._tr("update_status_found", f"Update found: v{new_version}"))
+        self.update_status_label.setText(self._tr("update_status_found", "Update found: v{version}", version=new_version))
         self.check_update_button.setEnabled(True)
         
         reply = QMessageBox.question(self, self._tr("update_available_title", "Update Available"),
-                                     self._tr("update_available_message", f"A new version (v{new_version}) is available.\nWould you like to download and install it now?"),
+                                     self._tr("update_available_message", "A new version (v{version}) is available.\nWould you like to download and install it now?", version=new_version),
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
         if reply == QMessageBox.Yes:
+            from ...services.updater import UpdateDownloader
+
             self.ok_button.setEnabled(False)
             self.check_update_button.setEnabled(False)
             self.update_status_label.setText(self._tr("update_status_downloading", "Downloading update..."))
             self.update_downloader_thread = UpdateDownloader(download_url, self.parent_app)
-            self.update_downloader_thread.download_finished.connect(self._on_download_finished)
-            self.update_downloader_thread.download_error.connect(self._on_update_error)
+            self.update_downloader_thread.signals.download_progress.connect(self._on_download_progress)
+            self.update_downloader_thread.signals.download_finished.connect(self._on_download_finished)
+            self.update_downloader_thread.signals.download_error.connect(self._on_update_error)
             self.update_downloader_thread.start()
 
+    def _on_download_progress(self, downloaded_bytes, total_bytes):
+        downloaded_mb = downloaded_bytes / (1024 * 1024)
+        if total_bytes > 0:
+            total_mb = total_bytes / (1024 * 1024)
+            self.update_status_label.setText(f"{self._tr('update_status_downloading', 'Downloading update...')} {downloaded_mb:.1f} / {total_mb:.1f} MB")
+        else:
+            self.update_status_label.setText(f"{self._tr('update_status_downloading', 'Downloading update...')} {downloaded_mb:.1f} MB")
+
     def _on_download_finished(self):
         QApplication.instance().quit()
     
     def _on_up_to_date(self, message):
-        self.update_status_label.setText(self._tr("update_status_latest", message))
+        self.update_status_label.setText(message)
         self.check_update_button.setEnabled(True)
     
     def _on_update_error(self, message):
-        self.update_status_label.setText(self._tr("update_status_error", f"Error: {message}"))
+        self.update_status_label.setText(self._tr("update_status_error", "Error: {message}", message=message))
         self.check_update_button.setEnabled(True)
         self.ok_button.setEnabled(True)
 
-    def _load_checkbox_states(self):
-        self.save_creator_json_checkbox.blockSignals(True)
-        should_save = self.parent_app.settings.value(SAVE_CREATOR_JSON_KEY, True, type=bool)
-        self.save_creator_json_checkbox.setChecked(should_save)
-        self.save_creator_json_checkbox.blockSignals(False)
+    def _load_settings_snapshot(self):
+        """Reads the settings shown by the dialog once, so retranslations don't re-query QSettings."""
+        settings = self.parent_app.settings
+        self._settings_cache = {
+            key: settings.value(key, default, type=value_type)
+            for key, default, value_type in (
+                (SAVE_CREATOR_JSON_KEY, True, bool),
+                (FETCH_FIRST_KEY, False, bool),
+                (RESOLUTION_KEY, "Auto", str),
+                (UI_SCALE_KEY, 1.0, float),
+                (POST_DOWNLOAD_ACTION_KEY, "off", str),
+                (DATE_PREFIX_FORMAT_KEY, "YYYY-MM-DD {post}", str),
+            )
+        }
+
+    def _store_setting(self, key, value):
+        """Writes a setting and keeps the dialog's snapshot in step with it."""
+        self.parent_app.settings.setValue(key, value)
+        if key in self._settings_cache:
+            self._settings_cache[key] = value
 
-        self.fetch_first_checkbox.blockSignals(True)
-        should_fetch_first = self.parent_app.settings.value(FETCH_FIRST_KEY, False, type=bool)
-        self.fetch_first_checkbox.setChecked(should_fetch_first)
-        self.fetch_first_checkbox.blockSignals(False)
+    def _load_checkbox_states(self):
+        for checkbox, key in ((self.save_creator_json_checkbox, SAVE_CREATOR_JSON_KEY),
+                              (self.fetch_first_checkbox, FETCH_FIRST_KEY)):
+            should_check = self._settings_cache[key]
+            if checkbox.isChecked() != should_check: # Leave the box alone when it already matches
+                with QSignalBlocker(checkbox):
+                    checkbox.setChecked(should_check)
 
     def _creator_json_setting_changed(self, state):
         is_checked = state == Qt.Checked
-        self.parent_app.settings.setValue(SAVE_CREATOR_JSON_KEY, is_checked)
-        self.parent_app.settings.sync()
+        self._store_setting(SAVE_CREATOR_JSON_KEY, is_checked)
 
     def _fetch_first_setting_changed(self, state):
         is_checked = state == Qt.Checked
-        self.parent_app.settings.setValue(FETCH_FIRST_KEY, is_checked)
-        self.parent_app.settings.sync()
+        self._store_setting(FETCH_FIRST_KEY, is_checked)
 
-    def _tr(self, key, default_text=""):
+    def _tr(self, key, default_text="", **format_kwargs):
+        """Translates key; any keyword arguments are formatted into the resulting text."""
         if callable(get_translation) and self.parent_app:
-            return get_translation(self.parent_app.current_selected_language, key, default_text)
-        return default_text
-
-    def _apply_theme(self):
-        if self.parent_app and self.parent_app.current_theme == "dark":
-            scale = getattr(self.parent_app, 'scale_factor', 1)
-            self.setStyleSheet(get_dark_theme(scale))
+            text = get_translation(self.parent_app.current_selected_language, key, default_text)
         else:
-            self.setStyleSheet("")
+            text = default_text
+        return text.format(**format_kwargs) if format_kwargs else text
+
+    def _translation_table(self):
+        """Returns the merged translation table for the current language."""
+        if self.parent_app:
+            return get_translation_table(self.parent_app.current_selected_language)
+        return {}
 
     def _update_theme_toggle_button_text(self):
         if self.parent_app.current_theme == "dark":
@@ -341,78 +425,75 @@ class FutureSettingsDialog(QDialog):
     def _toggle_theme(self):
         new_theme = "light" if self.parent_app.current_theme == "dark" else "dark"
         self.parent_app.settings.setValue(THEME_KEY, new_theme)
-        self.parent_app.settings.sync()
+        self.parent_app.settings.sync() # The restart prompt below may relaunch the app right away
         self.parent_app.current_theme = new_theme
-        self._apply_theme()
         if hasattr(self.parent_app, '_apply_theme_and_restart_prompt'):
             self.parent_app._apply_theme_and_restart_prompt()
 
+    def _fill_combo_box(self, combo_box, items, current_data_matches):
+        """
+        Refills a combo box from (text, data) pairs with its signals blocked and
+        selects the first item whose data satisfies current_data_matches.
+        """
+        with QSignalBlocker(combo_box):
+            combo_box.clear()
+            current_index = -1
+            for text, data in items:
+                combo_box.addItem(text, data)
+                if current_index < 0 and current_data_matches(data):
+                    current_index = combo_box.count() - 1
+            if current_index >= 0:
+                combo_box.setCurrentIndex(current_index)
+
     def _populate_display_combo_boxes(self):
-        self.resolution_combo_box.blockSignals(True)
-        self.resolution_combo_box.clear()
-        resolutions = [("Auto", "Auto"), ("1280x720", "1280x720"), ("1600x900", "1600x900"), ("1920x1080", "1920x1080")]
-        current_res = self.parent_app.settings.value(RESOLUTION_KEY, "Auto")
-        for res_key, res_name in resolutions:
-            self.resolution_combo_box.addItem(res_name, res_key)
-            if current_res == res_key:
-                self.resolution_combo_box.setCurrentIndex(self.resolution_combo_box.count() - 1)
-        self.resolution_combo_box.blockSignals(False)
-
-        self.ui_scale_combo_box.blockSignals(True)
-        self.ui_scale_combo_box.clear()
-        scales = [
-            (0.5, "50%"), (0.7, "70%"), (0.9, "90%"), (1.0, "100% (Default)"),
-            (1.25, "125%"), (1.50, "150%"), (1.75, "175%"), (2.0, "200%")
-        ]
-        current_scale = self.parent_app.settings.value(UI_SCALE_KEY, 1.0)
-        for scale_val, scale_name in scales:
-            self.ui_scale_combo_box.addItem(scale_name, scale_val)
-            if abs(float(current_scale) - scale_val) < 0.01:
-                self.ui_scale_combo_box.setCurrentIndex(self.ui_scale_combo_box.count() - 1)
-        self.ui_scale_combo_box.blockSignals(False)
+        current_res = self._settings_cache[RESOLUTION_KEY]
+        self._fill_combo_box(self.resolution_combo_box, _RESOLUTIONS, lambda res_key: res_key == current_res)
+
+        current_scale = self._settings_cache[UI_SCALE_KEY]
+        self._fill_combo_box(self.ui_scale_combo_box, _SCALES, lambda scale_val: abs(current_scale - scale_val) < 0.01)
+
+    def _create_debounce_timer(self, interval_ms, slot):
+        """Creates a single-shot timer that runs slot once changes stop for interval_ms."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval_ms)
+        timer.timeout.connect(slot)
+        return timer
+
+    def _show_restart_required(self):
+        """Shows the inline notice that a restart is needed for the changes to apply."""
+        self.restart_required_label.setText(self._tr("language_change_message", "A restart is required..."))
+        self.restart_required_label.show()
 
     def _display_setting_changed(self):
+        self._display_change_timer.start()
+
+    def _apply_display_setting(self):
         selected_res = self.resolution_combo_box.currentData()
         selected_scale = self.ui_scale_combo_box.currentData()
-        self.parent_app.settings.setValue(RESOLUTION_KEY, selected_res)
-        self.parent_app.settings.setValue(UI_SCALE_KEY, selected_scale)
-        self.parent_app.settings.sync()
-        QMessageBox.information(self, self._tr("display_change_title", "Display Settings Changed"),
-                                self._tr("language_change_message", "A restart is required..."))
+        self._store_setting(RESOLUTION_KEY, selected_res)
+        self._store_setting(UI_SCALE_KEY, selected_scale)
+        self._show_restart_required()
 
     def _populate_language_combo_box(self):
-        self.language_combo_box.blockSignals(True)
-        self.language_combo_box.clear()
-        languages = [
-            ("en", "English"), ("ja", "日本語 (Japanese)"), ("fr", "Français (French)"),
-            ("de", "Deutsch (German)"), ("es", "Español (Spanish)"), ("pt", "Português (Portuguese)"),
-            ("ru", "Русский (Russian)"), ("zh_CN", "简体中文 (Simplified Chinese)"),
-            ("zh_TW", "繁體中文 (Traditional Chinese)"), ("ko", "한국어 (Korean)")
-        ]
         current_lang = self.parent_app.current_selected_language
-        for lang_code, lang_name in languages:
-            self.language_combo_box.addItem(lang_name, lang_code)
-            if current_lang == lang_code:
-                self.language_combo_box.setCurrentIndex(self.language_combo_box.count() - 1)
-        self.language_combo_box.blockSignals(False)
+        self._fill_combo_box(self.language_combo_box, _LANGUAGES, lambda lang_code: lang_code == current_lang)
 
     def _language_selection_changed(self, index):
-        selected_lang_code = self.language_combo_box.itemData(index)
+        self._language_change_timer.start()
+
+    def _apply_language_selection(self):
+        selected_lang_code = self.language_combo_box.currentData()
         if selected_lang_code and selected_lang_code != self.parent_app.current_selected_language:
             self.parent_app.settings.setValue(LANGUAGE_KEY, selected_lang_code)
-            self.parent_app.settings.sync()
             self.parent_app.current_selected_language = selected_lang_code
             self._retranslate_ui()
             if hasattr(self.parent_app, '_retranslate_main_ui'):
                 self.parent_app._retranslate_main_ui()
-            QMessageBox.information(self, self._tr("language_change_title", "Language Changed"),
-                                    self._tr("language_change_message", "A restart is required..."))
+            self._show_restart_required()
 
     def _populate_post_download_action_combo(self):
         """Populates the action dropdown and sets the current selection from settings."""
-        self.post_download_action_combo.blockSignals(True)
-        self.post_download_action_combo.clear()
-        
         actions = [
             (self._tr("action_off", "Off"), "off"),
             (self._tr("action_notify", "Notify with Sound"), "notify"),
@@ -420,35 +501,48 @@ class FutureSettingsDialog(QDialog):
             (self._tr("action_shutdown", "Shutdown"), "shutdown")
         ]
         
-        current_action = self.parent_app.settings.value(POST_DOWNLOAD_ACTION_KEY, "off")
-        
-        for text, key in actions:
-            self.post_download_action_combo.addItem(text, key)
-            if current_action == key:
-                self.post_download_action_combo.setCurrentIndex(self.post_download_action_combo.count() - 1)
-        
-        self.post_download_action_combo.blockSignals(False)
+        current_action = self._settings_cache[POST_DOWNLOAD_ACTION_KEY]
+        self._fill_combo_box(self.post_download_action_combo, actions, lambda key: key == current_action)
 
     def _post_download_action_changed(self):
         """Saves the selected post-download action to settings."""
         selected_action = self.post_download_action_combo.currentData()
-        self.parent_app.settings.setValue(POST_DOWNLOAD_ACTION_KEY, selected_action)
-        self.parent_app.settings.sync()
+        self._store_setting(POST_DOWNLOAD_ACTION_KEY, selected_action)
 
     def _load_date_prefix_format(self):
         """Loads the saved date prefix format and sets it in the input field."""
-        self.date_prefix_format_input.blockSignals(True)
-        current_format = self.parent_app.settings.value(DATE_PREFIX_FORMAT_KEY, "YYYY-MM-DD {post}", type=str)
-        self.date_prefix_format_input.setText(current_format)
-        self.date_prefix_format_input.blockSignals(False)
+        current_format = self._settings_cache[DATE_PREFIX_FORMAT_KEY]
+        with QSignalBlocker(self.date_prefix_format_input):
+            self.date_prefix_format_input.setText(current_format)
 
     def _date_prefix_format_changed(self, text):
-        """Saves the date prefix format whenever it's changed."""
-        self.parent_app.settings.setValue(DATE_PREFIX_FORMAT_KEY, text)
-        self.parent_app.settings.sync()
+        """Updates the live date prefix format and schedules saving it once typing pauses."""
         # Also update the live value in the parent app
         if hasattr(self.parent_app, 'date_prefix_format'):
             self.parent_app.date_prefix_format = text
+        # The snapshot follows the typed text right away so a retranslation can't restore an older value
+        self._settings_cache[DATE_PREFIX_FORMAT_KEY] = text
+        self._pending_date_prefix = text
+        self._save_timer.start()
+
+    def _flush_date_prefix_format(self):
+        """Writes the last typed date prefix format to settings."""
+        if self._pending_date_prefix is None:
+            return
+        self.parent_app.settings.setValue(DATE_PREFIX_FORMAT_KEY, self._pending_date_prefix)
+        self._pending_date_prefix = None
+
+    def done(self, result):
+        """Saves any pending debounced edit and flushes all changed settings to disk once."""
+        self._save_timer.stop()
+        self._flush_date_prefix_format()
+        for timer, apply_change in ((self._display_change_timer, self._apply_display_setting),
+                                    (self._language_change_timer, self._apply_language_selection)):
+            if timer.isActive():
+                timer.stop()
+                apply_change()
+        self.parent_app.settings.sync()
+        super().done(result)
 
     def _save_settings(self):
         path_saved = False
@@ -473,14 +567,11 @@ class FutureSettingsDialog(QDialog):
                 self.parent_app.settings.setValue(COOKIE_TEXT_KEY, "")
         
         if (hasattr(self.parent_app, 'remove_from_filename_input') and
-                hasattr(self.parent_app, 'remove_from_filename_label_widget')):
-            
-            label_text = self.parent_app.remove_from_filename_label_widget.text()
-            if "Token" in label_text:
-                discord_token = self.parent_app.remove_from_filename_input.text().strip()
-                if discord_token:
-                    self.parent_app.settings.setValue(DISCORD_TOKEN_KEY, discord_token)
-                    token_saved = True
+                getattr(self.parent_app, 'remove_from_filename_role', None) == "discord_token"):
+            discord_token = self.parent_app.remove_from_filename_input.text().strip()
+            if discord_token:
+                self.parent_app.settings.setValue(DISCORD_TOKEN_KEY, discord_token)
+                token_saved = True
         
         self.parent_app.settings.sync()
 
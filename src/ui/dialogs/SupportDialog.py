@@ -2,16 +2,77 @@
 
 import sys
 import os
+import functools
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
     QPushButton, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QSize, QUrl
-from PyQt5.QtGui import QPixmap, QDesktopServices
+from PyQt5.QtCore import Qt, QSize, QUrl, pyqtSlot
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache, QDesktopServices
 
 from ...utils.resolution import get_dark_theme
 
+# Assets live next to the source tree in development and under _MEIPASS when packaged
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    _ASSETS_BASE = sys._MEIPASS
+else:
+    _ASSETS_BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+_ASSETS_DIR = os.path.join(_ASSETS_BASE, 'assets')
+
+
+def _load_scaled_icon(icon_path, size):
+    """
+    Returns the icon at icon_path scaled to size x size, loading and scaling it
+    only once per path and size thanks to QPixmapCache. Returns a null pixmap if
+    the file can't be loaded.
+    """
+    key = f"{icon_path}@{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        raw_pixmap = QPixmap(icon_path)
+        if raw_pixmap.isNull():
+            return raw_pixmap
+        raw_size = raw_pixmap.size()
+        if raw_size.width() == size and raw_size.height() == size:
+            pixmap = raw_pixmap  # Already the right size, nothing to scale
+        else:
+            # Smooth scaling is only paid once per size, since the result is cached below
+            pixmap = raw_pixmap.scaled(QSize(size, size), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# Card rules are added to the dialog's own stylesheet once, rather than parsed per button
+_CARD_LABELS_QSS = """
+    QLabel#card_title { background-color: transparent; border: none; }
+    QLabel#card_subtitle { color: #A8A8A8; background-color: transparent; border: none; }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _card_button_qss(hover_color):
+    """Returns the stylesheet rules for cards with the given hover color, matched by object name."""
+    name = _card_object_name(hover_color)
+    return f"""
+    QPushButton#{name} {{
+        background-color: #3A3A3A;
+        border: 1px solid #555;
+        border-radius: 10px;
+        text-align: center;
+        padding: 12px;
+    }}
+    QPushButton#{name}:hover {{
+        background-color: {hover_color};
+        border: 1px solid #777;
+    }}
+"""
+
+
+def _card_object_name(hover_color):
+    """Object name shared by all cards with the same hover color, e.g. 'card_2B2F36'."""
+    return "card_" + hover_color.lstrip('#')
+
 
 class SupportDialog(QDialog):
     """
@@ -21,12 +82,31 @@ class SupportDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_app = parent
+        self._card_hover_colors = {}  # Ordered set of hover colors used by the cards
+
+        # Fonts shared by every label of the same kind (QFont is implicitly shared)
+        self._title_font = self._bold_font(11)
+        self._section_font = self._bold_font(13)
+        self._header_font = self._bold_font(17)
 
         self.setWindowTitle("❤️ Support & Community")
         self.setMinimumWidth(560)
 
-        self._init_ui()
-        self._apply_theme()
+        # Build and style everything with updates off, then lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._init_ui()
+            self._apply_theme()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.layout().activate()
+
+    def _bold_font(self, point_size):
+        """Returns a bold copy of the dialog font at the given point size."""
+        font = QFont(self.font())
+        font.setPointSize(point_size)
+        font.setBold(True)
+        return font
 
     def _create_card_button(
         self, icon_path, title, subtitle, url,
@@ -38,63 +118,57 @@ class SupportDialog(QDialog):
         button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         button.setMinimumHeight(min_height)
 
-        # Consistent style
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #3A3A3A;
-                border: 1px solid #555;
-                border-radius: 10px;
-                text-align: center;
-                padding: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-                border: 1px solid #777;
-            }}
-        """)
+        # Consistent style, applied through the dialog stylesheet in _apply_theme
+        button.setObjectName(_card_object_name(hover_color))
+        self._card_hover_colors[hover_color] = None
 
         layout = QVBoxLayout(button)
         layout.setSpacing(6)
 
         # Icon
         icon_label = QLabel()
-        pixmap = QPixmap(icon_path)
+        scale = getattr(self.parent_app, 'scale_factor', 1.0)
+        pixmap = _load_scaled_icon(icon_path, int(icon_size * scale))
         if not pixmap.isNull():
-            scale = getattr(self.parent_app, 'scale_factor', 1.0)
-            scaled_size = int(icon_size * scale)
-            icon_label.setPixmap(
-                pixmap.scaled(QSize(scaled_size, scaled_size), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            icon_label.setPixmap(pixmap)
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
 
         # Title
         title_label = QLabel(title)
-        font = self.font()
-        font.setPointSize(11)
-        font.setBold(True)
-        title_label.setFont(font)
+        title_label.setFont(self._title_font)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("background-color: transparent; border: none;")
+        title_label.setObjectName("card_title")
         layout.addWidget(title_label)
 
         # Subtitle
         if subtitle:
             subtitle_label = QLabel(subtitle)
-            subtitle_label.setStyleSheet("color: #A8A8A8; background-color: transparent; border: none;")
+            subtitle_label.setObjectName("card_subtitle")
             subtitle_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(subtitle_label)
 
-        button.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(url)))
+        # The card paints its own styled background; the labels are just drawn on top
+        # and let hover/clicks fall through to the button
+        button.setAttribute(Qt.WA_StyledBackground, True)
+        for child in button.findChildren(QLabel):
+            child.setAutoFillBackground(False)
+            child.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+
+        # The QUrl is parsed once here and read back by the shared click slot
+        button.setProperty("card_url", QUrl(url))
+        button.clicked.connect(self._open_card_url)
         return button
 
+    @pyqtSlot()
+    def _open_card_url(self):
+        """Opens the link of the card button that was clicked."""
+        QDesktopServices.openUrl(self.sender().property("card_url"))
+
     def _create_section_title(self, text):
         """Stylized section heading."""
         label = QLabel(text)
-        font = label.font()
-        font.setPointSize(13)
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(self._section_font)
         label.setAlignment(Qt.AlignCenter)
         label.setStyleSheet("margin-top: 10px; margin-bottom: 5px;")
         return label
@@ -106,10 +180,7 @@ class SupportDialog(QDialog):
 
         # Header
         header_label = QLabel("Support the Project")
-        font = header_label.font()
-        font.setPointSize(17)
-        font.setBold(True)
-        header_label.setFont(font)
+        header_label.setFont(self._header_font)
         header_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(header_label)
 
@@ -193,15 +264,14 @@ class SupportDialog(QDialog):
     def _apply_theme(self):
         if self.parent_app and hasattr(self.parent_app, 'current_theme') and self.parent_app.current_theme == "dark":
             scale = getattr(self.parent_app, 'scale_factor', 1)
-            self.setStyleSheet(get_dark_theme(scale))
+            base_theme = get_dark_theme(scale)
         else:
-            self.setStyleSheet("")
+            base_theme = ""
+        card_rules = "".join(_card_button_qss(color) for color in self._card_hover_colors)
+        self.setStyleSheet(base_theme + _CARD_LABELS_QSS + card_rules)
 
 
+@functools.lru_cache(maxsize=None)
 def get_asset_path(filename):
     """Return the path to an asset, works in both dev and packaged environments."""
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-    return os.path.join(base_path, 'assets', filename)
+    return os.path.join(_ASSETS_DIR, filename)
@@ -1,16 +1,70 @@
 import os
 import sys
+import functools
 from PyQt5.QtCore import pyqtSignal, Qt, QSettings
+from PyQt5.QtGui import QColor, QPainter
 from PyQt5.QtWidgets import (
     QApplication, QDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout,
     QStackedWidget, QScrollArea, QFrame, QWidget, QCheckBox
 )
-from ...i18n.translator import get_translation
+from ...i18n.translator import get_translation_table
 from ..main_window import get_app_icon_object
 from ...utils.resolution import get_dark_theme
 from ...config.constants import CONFIG_ORGANIZATION_NAME
 
 
+# Cached result of TourDialog.should_show_tour(); None until first read
+_should_show_tour_cache = None
+_tour_settings = None  # Shared QSettings for the tour, created on first use
+
+
+def _get_tour_settings():
+    """Returns the tour's QSettings object, shared by every TourDialog and should_show_tour."""
+    global _tour_settings
+    if _tour_settings is None:
+        _tour_settings = QSettings(TourDialog.CONFIG_ORGANIZATION_NAME, TourDialog.CONFIG_APP_NAME_TOUR)
+    return _tour_settings
+
+
+# Tour-specific rules appended to the dark theme
+_TOUR_DARK_STYLES = """
+    QDialog {
+        background-color: #2D2D30;
+    }
+    #bottomFrame {
+        background-color: #252526;
+        border-top: 1px solid #3E3E42;
+    }
+    #contentFrame {
+        border: 1px solid #3E3E42;
+        border-radius: 5px;
+    }
+    QScrollArea {
+        background-color: transparent;
+        border: none;
+    }
+    #nextButton {
+        background-color: #007ACC;
+        border: 1px solid #005A9E;
+        padding: 8px 18px;
+        font-weight: bold;
+    }
+    #nextButton:hover {
+        background-color: #1E90FF;
+    }
+    #nextButton:disabled {
+        background-color: #444;
+        border-color: #555;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _dark_tour_stylesheet(scale):
+    """Returns the dark theme plus the tour rules for a scale, built once per scale."""
+    return get_dark_theme(scale) + _TOUR_DARK_STYLES
+
+
 class TourStepWidget(QWidget):
     """
     A custom widget for a single tour page, with improved styling for titles and content.
@@ -41,8 +95,12 @@ class TourStepWidget(QWidget):
         content_label = QLabel(content_text)
         content_label.setWordWrap(True)
         content_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        content_label.setTextFormat(Qt.RichText)
-        content_label.setOpenExternalLinks(True)
+        # Only pay for rich-text layout when the content actually contains markup
+        if '<' in content_text and '>' in content_text:
+            content_label.setTextFormat(Qt.RichText)
+            content_label.setOpenExternalLinks(True)
+        else:
+            content_label.setTextFormat(Qt.PlainText)
         # Indent the content slightly for better readability
         content_label.setStyleSheet("font-size: 11pt; color: #C8C8C8; padding-left: 5px; padding-right: 5px;")
         
@@ -51,6 +109,37 @@ class TourStepWidget(QWidget):
         layout.addWidget(content_frame, 1)
 
 
+class ProgressDots(QWidget):
+    """
+    The tour's step indicator: a row of dots drawn in a single paintEvent,
+    with the dot for the current step highlighted.
+    """
+    DOT_SIZE = 12
+    DOT_SPACING = 18
+
+    def __init__(self, count, parent=None):
+        super().__init__(parent)
+        self._count = count
+        self._active = 0
+        self.setFixedHeight(self.DOT_SIZE + 4)
+
+    def set_active(self, index):
+        if index != self._active:
+            self._active = index
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        first_center_x = self.width() / 2 - (self._count - 1) * self.DOT_SPACING / 2
+        for i in range(self._count):
+            is_active = i == self._active
+            painter.setBrush(QColor("#007ACC") if is_active else QColor("#555"))
+            painter.setPen(QColor("#005A9E") if is_active else QColor("#4F4F4F"))
+            left = int(first_center_x + i * self.DOT_SPACING) - self.DOT_SIZE // 2
+            painter.drawEllipse(left, 2, self.DOT_SIZE, self.DOT_SIZE)
+
+
 class TourDialog(QDialog):
     """
     A redesigned, multi-page tour dialog with a visual progress indicator.
@@ -63,23 +152,28 @@ class TourDialog(QDialog):
 
     def __init__(self, parent_app, parent=None):
         super().__init__(parent)
-        self.settings = QSettings(self.CONFIG_ORGANIZATION_NAME, self.CONFIG_APP_NAME_TOUR)
+        self.settings = _get_tour_settings()
         self.current_step = 0
         self.parent_app = parent_app
-        self.progress_dots = []
+        # Resolved once; every label and lazily built page then costs one dict lookup
+        self._translations = get_translation_table(parent_app.current_selected_language) if parent_app else {}
+        # Every lookup passes its default text, so _tr is just the table's bound get
+        self._tr = self._translations.get
 
         self.setWindowIcon(get_app_icon_object())
         self.setModal(True)
         self.setFixedSize(680, 650)
         
-        self._init_ui()
-        self._apply_theme()
-        self._center_on_screen()
+        self._centered = False # Centering waits for the first show, when the final size is known
 
-    def _tr(self, key, default_text=""):
-        if callable(get_translation) and self.parent_app:
-            return get_translation(self.parent_app.current_selected_language, key, default_text)
-        return default_text
+        # Build and style everything with updates off, then lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._init_ui()
+            self._apply_theme()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.layout().activate()
 
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -101,11 +195,9 @@ class TourDialog(QDialog):
             ("tour_dialog_step8_title", "tour_dialog_step8_content"),
         ]
 
-        for title_key, content_key in steps_content:
-            title = self._tr(title_key, title_key)
-            content = self._tr(content_key, "Content not found.")
-            step_widget = TourStepWidget(title, content)
-            self.stacked_widget.addWidget(step_widget)
+        # Pages are built on demand; only the first one is laid out before the dialog shows
+        self._steps_content = steps_content
+        self._ensure_step_built(0)
 
         self.setWindowTitle(self._tr("tour_dialog_title", "Welcome to Kemono Downloader!"))
         
@@ -119,16 +211,8 @@ class TourDialog(QDialog):
         bottom_controls_layout.setSpacing(15)
 
         # --- Progress Indicator ---
-        progress_layout = QHBoxLayout()
-        progress_layout.addStretch()
-        for i in range(len(steps_content)):
-            dot = QLabel()
-            dot.setObjectName("progressDot")
-            dot.setFixedSize(12, 12)
-            self.progress_dots.append(dot)
-            progress_layout.addWidget(dot)
-        progress_layout.addStretch()
-        bottom_controls_layout.addLayout(progress_layout)
+        self.progress_dots = ProgressDots(len(steps_content))
+        bottom_controls_layout.addWidget(self.progress_dots)
 
         # --- Buttons and Checkbox ---
         buttons_and_check_layout = QHBoxLayout()
@@ -152,63 +236,40 @@ class TourDialog(QDialog):
 
         self._update_ui_states()
 
+    def _ensure_step_built(self, step_index):
+        """Builds the tour pages up to and including step_index, if not built yet."""
+        while self.stacked_widget.count() <= step_index:
+            title_key, content_key = self._steps_content[self.stacked_widget.count()]
+            title = self._tr(title_key, title_key)
+            content = self._tr(content_key, "Content not found.")
+            self.stacked_widget.addWidget(TourStepWidget(title, content))
+
     def _apply_theme(self):
         if self.parent_app and self.parent_app.current_theme == "dark":
             scale = getattr(self.parent_app, 'scale_factor', 1)
-            dark_theme_base = get_dark_theme(scale)
-            tour_styles = """
-                QDialog {
-                    background-color: #2D2D30;
-                }
-                #bottomFrame {
-                    background-color: #252526;
-                    border-top: 1px solid #3E3E42;
-                }
-                #contentFrame {
-                    border: 1px solid #3E3E42;
-                    border-radius: 5px;
-                }
-                QScrollArea {
-                    background-color: transparent;
-                    border: none;
-                }
-                #progressDot {
-                    background-color: #555;
-                    border-radius: 6px;
-                    border: 1px solid #4F4F4F;
-                }
-                #progressDot[active="true"] {
-                    background-color: #007ACC;
-                    border: 1px solid #005A9E;
-                }
-                #nextButton {
-                    background-color: #007ACC;
-                    border: 1px solid #005A9E;
-                    padding: 8px 18px;
-                    font-weight: bold;
-                }
-                #nextButton:hover {
-                    background-color: #1E90FF;
-                }
-                #nextButton:disabled {
-                    background-color: #444;
-                    border-color: #555;
-                }
-            """
-            self.setStyleSheet(dark_theme_base + tour_styles)
+            self.setStyleSheet(_dark_tour_stylesheet(scale))
         else:
             self.setStyleSheet("QDialog { background-color: #f0f0f0; }")
 
     def _center_on_screen(self):
-        try:
-            screen_geo = QApplication.primaryScreen().availableGeometry()
-            self.move(screen_geo.center() - self.rect().center())
-        except Exception as e:
-            print(f"[TourDialog] Error centering dialog: {e}")
+        # The dialog's own screen avoids querying the primary screen (Qt 5.14+)
+        screen = self.screen() if hasattr(self, 'screen') else None
+        screen = screen or QApplication.primaryScreen()
+        if screen is None:
+            return
+        screen_geo = screen.availableGeometry()
+        self.move(screen_geo.center() - self.rect().center())
+
+    def showEvent(self, event):
+        if not self._centered:
+            self._center_on_screen()
+            self._centered = True
+        super().showEvent(event)
 
     def _next_step_action(self):
-        if self.current_step < self.stacked_widget.count() - 1:
+        if self.current_step < len(self._steps_content) - 1:
             self.current_step += 1
+            self._ensure_step_built(self.current_step)
             self.stacked_widget.setCurrentIndex(self.current_step)
         else:
             self._finish_tour_action()
@@ -221,14 +282,17 @@ class TourDialog(QDialog):
         self._update_ui_states()
 
     def _update_ui_states(self):
-        is_last_step = self.current_step == self.stacked_widget.count() - 1
-        self.next_button.setText(self._tr("tour_dialog_finish_button", "Finish") if is_last_step else self._tr("tour_dialog_next_button", "Next"))
-        self.back_button.setEnabled(self.current_step > 0)
-        self.skip_button.setVisible(not is_last_step)
-
-        for i, dot in enumerate(self.progress_dots):
-            dot.setProperty("active", i == self.current_step)
-            dot.style().polish(dot)
+        is_last_step = self.current_step == len(self._steps_content) - 1
+        # Batch the control changes below into one repaint (updates may already be off during construction)
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.next_button.setText(self._tr("tour_dialog_finish_button", "Finish") if is_last_step else self._tr("tour_dialog_next_button", "Next"))
+            self.back_button.setEnabled(self.current_step > 0)
+            self.skip_button.setVisible(not is_last_step)
+            self.progress_dots.set_active(self.current_step)
+        finally:
+            self.setUpdatesEnabled(updates_were_enabled)
 
     def _skip_tour_action(self):
         self._save_settings_if_checked()
@@ -241,14 +305,19 @@ class TourDialog(QDialog):
         self.accept()
 
     def _save_settings_if_checked(self):
-        self.settings.setValue(self.TOUR_SHOWN_KEY, self.never_show_again_checkbox.isChecked())
-        self.settings.sync()
+        global _should_show_tour_cache
+        never_show = self.never_show_again_checkbox.isChecked()
+        self.settings.setValue(self.TOUR_SHOWN_KEY, never_show)
+        _should_show_tour_cache = not never_show
 
     @staticmethod
     def should_show_tour():
-        settings = QSettings(TourDialog.CONFIG_ORGANIZATION_NAME, TourDialog.CONFIG_APP_NAME_TOUR)
-        never_show = settings.value(TourDialog.TOUR_SHOWN_KEY, False, type=bool)
-        return not never_show
+        """Returns whether the tour should be shown, reading the settings store only once."""
+        global _should_show_tour_cache
+        if _should_show_tour_cache is None:
+            never_show = _get_tour_settings().value(TourDialog.TOUR_SHOWN_KEY, False, type=bool)
+            _should_show_tour_cache = not never_show
+        return _should_show_tour_cache
 
     def closeEvent(self, event):
         self._skip_tour_action()
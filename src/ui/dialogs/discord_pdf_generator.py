@@ -30,6 +30,30 @@ except ImportError:
     FPDF = None 
     PDF = None
 
+# Text colors used in the chat log
+_TEXT_COLOR = (0, 0, 0)
+_TIMESTAMP_COLOR = (128, 128, 128)
+_LINK_COLOR = (22, 119, 219)
+
+# Control characters (except tab and newline) dropped from message text, e.g. from bot/terminal pastes
+_CONTROL_CHARS_TABLE = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0A))
+
+# Shared read-only fallback for messages without an author object
+_EMPTY_DICT = {}
+
+# Regular font path -> verified bold font path, so the font files are only checked once
+_BOLD_FONT_CACHE = {}
+
+def _check_events(cancellation_event, pause_event):
+    """Returns True if generation should stop; blocks while paused. Either event may be None."""
+    if getattr(cancellation_event, 'is_cancelled', False):
+        return True
+    while getattr(pause_event, 'is_paused', False):
+        time.sleep(0.5)
+        if getattr(cancellation_event, 'is_cancelled', False):
+            return True
+    return False
+
 def create_pdf_from_discord_messages(messages_data, server_name, channel_name, output_filename, font_path, logger=print, cancellation_event=None, pause_event=None):
     """
     Creates a single PDF from a list of Discord message objects, formatted as a chat log.
@@ -43,28 +67,34 @@ def create_pdf_from_discord_messages(messages_data, server_name, channel_name, o
         logger("   No messages were found or fetched to create a PDF.")
         return False
 
-    # --- FIX: This helper function now correctly accepts and checks the event objects ---
-    def check_events(c_event, p_event):
-        """Helper to safely check for pause and cancel events."""
-        if c_event and hasattr(c_event, 'is_cancelled') and c_event.is_cancelled:
-            return True # Stop
-        if p_event and hasattr(p_event, 'is_paused'):
-            while p_event.is_paused:
-                time.sleep(0.5)
-                if c_event and hasattr(c_event, 'is_cancelled') and c_event.is_cancelled:
-                    return True
-        return False
-
     logger("   Sorting messages by date (oldest first)...")
-    messages_data.sort(key=lambda m: m.get('published', m.get('timestamp', '')))
-
+    # Each message's timestamp is looked up once, used as the sort key and reused when rendering
+    timestamps = [_message_timestamp(m) for m in messages_data]
+    order = sorted(range(len(messages_data)), key=timestamps.__getitem__)
+    messages_data[:] = [messages_data[idx] for idx in order]
+    timestamps = [timestamps[idx] for idx in order]
+
+    return _render_chat_log_pdf(
+        zip(timestamps, messages_data), len(messages_data), server_name, channel_name,
+        output_filename, font_path, logger, cancellation_event, pause_event
+    )
+
+def _message_timestamp(message):
+    """The timestamp string a message is sorted and labelled by."""
+    return message.get('published') or message.get('timestamp') or ''
+
+def _render_chat_log_pdf(timestamped_messages, total_count, server_name, channel_name, output_filename, font_path, logger, cancellation_event, pause_event):
+    """Writes the chat log PDF from (timestamp, message) pairs in display order."""
     pdf = PDF(server_name, channel_name)
     default_font_family = 'DejaVu'
     
     try:
-        bold_font_path = font_path.replace("DejaVuSans.ttf", "DejaVuSans-Bold.ttf")
-        if not os.path.exists(font_path) or not os.path.exists(bold_font_path):
-            raise RuntimeError("Font files not found")
+        bold_font_path = _BOLD_FONT_CACHE.get(font_path)
+        if bold_font_path is None:
+            bold_font_path = os.path.join(os.path.dirname(font_path), "DejaVuSans-Bold.ttf")
+            if not os.path.exists(font_path) or not os.path.exists(bold_font_path):
+                raise RuntimeError("Font files not found")
+            _BOLD_FONT_CACHE[font_path] = bold_font_path
         
         pdf.add_font('DejaVu', '', font_path, uni=True)
         pdf.add_font('DejaVu', 'B', bold_font_path, uni=True)
@@ -84,70 +114,109 @@ def create_pdf_from_discord_messages(messages_data, server_name, channel_name, o
     pdf.ln(5)
     pdf.set_font(default_font_family, '', 10)
     pdf.cell(w=0, h=10, text=f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", align='C', new_x="LMARGIN", new_y="NEXT")
-    pdf.cell(w=0, h=10, text=f"Total Messages: {len(messages_data)}", align='C', new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(w=0, h=10, text=f"Total Messages: {total_count}", align='C', new_x="LMARGIN", new_y="NEXT")
     
     pdf.add_page()
     
-    logger(f"   Starting PDF creation with {len(messages_data)} messages...")
-
-    for i, message in enumerate(messages_data):
-        # --- FIX: Pass the event objects to the helper function ---
-        if i % 50 == 0:
-            if check_events(cancellation_event, pause_event):
-                logger("   PDF generation cancelled by user.")
-                return False
-
-        author = message.get('author', {}).get('global_name') or message.get('author', {}).get('username', 'Unknown User')
-        timestamp_str = message.get('published', message.get('timestamp', ''))
+    logger(f"   Starting PDF creation with {total_count} messages...")
+
+    # fpdf2 methods are bound once, and font/text color are only set when they change
+    # (add_page restores both after the header, so the tracked state stays valid)
+    set_font, set_text_color = pdf.set_font, pdf.set_text_color
+    write, ln, multi_cell = pdf.write, pdf.ln, pdf.multi_cell
+    get_string_width = pdf.get_string_width
+    # Text width a cell spanning the page can hold, same as one line of multi_cell
+    single_line_width = pdf.epw - 2 * pdf.c_margin
+    current_font = None
+    current_color = _TEXT_COLOR  # fpdf2's default, untouched by the title page
+
+    def use_font(style, size):
+        nonlocal current_font
+        if current_font != (style, size):
+            set_font(default_font_family, style, size)
+            current_font = (style, size)
+
+    def use_color(rgb):
+        nonlocal current_color
+        if current_color != rgb:
+            set_text_color(*rgb)
+            current_color = rgb
+
+    pdf.set_draw_color(200, 200, 200)
+
+    for i, (timestamp_str, message) in enumerate(timestamped_messages):
+        if i % 50 == 0 and _check_events(cancellation_event, pause_event):
+            logger("   PDF generation cancelled by user.")
+            return False
+
+        author_info = message.get('author') or _EMPTY_DICT
+        author = author_info.get('global_name') or author_info.get('username', 'Unknown User')
         content = message.get('content', '')
-        attachments = message.get('attachments', [])
-        embeds = message.get('embeds', [])
-
-        try:
-            if timestamp_str.endswith('Z'):
-                timestamp_str = timestamp_str[:-1] + '+00:00'
-            dt_obj = datetime.datetime.fromisoformat(timestamp_str)
-            formatted_timestamp = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
-        except (ValueError, TypeError):
-            formatted_timestamp = timestamp_str
+        attachments = message.get('attachments') or ()
+        embeds = message.get('embeds') or ()
+
+        # ISO-8601 stamps ("2024-01-31T12:34:56...") are reformatted by slicing, no datetime needed
+        if len(timestamp_str) >= 19 and timestamp_str[10] == 'T' and timestamp_str[13] == ':':
+            formatted_timestamp = timestamp_str[:10] + ' ' + timestamp_str[11:19]
+        else:
+            try:
+                if timestamp_str.endswith('Z'):
+                    timestamp_str = timestamp_str[:-1] + '+00:00'
+                dt_obj = datetime.datetime.fromisoformat(timestamp_str)
+                formatted_timestamp = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
+            except (ValueError, TypeError, AttributeError):
+                formatted_timestamp = timestamp_str
 
         if i > 0:
-            pdf.ln(2)
-            pdf.set_draw_color(200, 200, 200)
+            ln(2)
             pdf.cell(0, 0, '', border='T')
-            pdf.ln(2)
+            ln(2)
 
-        pdf.set_font(default_font_family, 'B', 11)
-        pdf.write(5, f"{author} ")
-        pdf.set_font(default_font_family, '', 9)
-        pdf.set_text_color(128, 128, 128)
-        pdf.write(5, f"({formatted_timestamp})")
-        pdf.set_text_color(0, 0, 0)
-        pdf.ln(6)
+        use_font('B', 11)
+        use_color(_TEXT_COLOR)
+        write(5, f"{author} ")
+        use_font('', 9)
+        use_color(_TIMESTAMP_COLOR)
+        write(5, f"({formatted_timestamp})")
+        ln(6)
 
         if content:
-            pdf.set_font(default_font_family, '', 10)
-            pdf.multi_cell(w=0, h=5, text=content)
+            use_font('', 10)
+            use_color(_TEXT_COLOR)
+            content = content.translate(_CONTROL_CHARS_TABLE)
+            # Most chat messages fit on one line: a plain cell skips multi_cell's wrapping pass
+            if '\n' not in content and get_string_width(content) <= single_line_width:
+                pdf.cell(w=0, h=5, text=content, new_x="LMARGIN", new_y="NEXT")
+            else:
+                multi_cell(w=0, h=5, text=content)
         
         if attachments or embeds:
-            pdf.ln(1)
-            pdf.set_font(default_font_family, '', 9)
-            pdf.set_text_color(22, 119, 219)
+            ln(1)
+            use_font('', 9)
+            use_color(_LINK_COLOR)
+
+            # Embeds often mirror an attachment; each URL is linked once, attachments first.
+            # Each link is one wrapping multi_cell that also moves to the next line.
+            seen_links = set()
 
             for att in attachments:
                 file_name = att.get('filename', 'untitled')
                 full_url = att.get('url', '#')
-                pdf.write(5, text=f"[Attachment: {file_name}]", link=full_url)
-                pdf.ln()
+                if full_url != '#':
+                    if full_url in seen_links:
+                        continue
+                    seen_links.add(full_url)
+                multi_cell(w=0, h=5, text=f"[Attachment: {file_name}]", link=full_url, new_x="LMARGIN", new_y="NEXT")
 
             for embed in embeds:
                 embed_url = embed.get('url', 'no url')
-                pdf.write(5, text=f"[Embed: {embed_url}]", link=embed_url)
-                pdf.ln()
-
-            pdf.set_text_color(0, 0, 0)
+                if embed_url != 'no url':
+                    if embed_url in seen_links:
+                        continue
+                    seen_links.add(embed_url)
+                multi_cell(w=0, h=5, text=f"[Embed: {embed_url}]", link=embed_url, new_x="LMARGIN", new_y="NEXT")
 
-    if check_events(cancellation_event, pause_event):
+    if _check_events(cancellation_event, pause_event):
         logger("   PDF generation cancelled by user before final save.")
         return False
 
@@ -40,7 +40,7 @@ from ..services.drive_downloader import (
     download_gofile_folder  
 )
 from ..core.workers import DownloadThread as BackendDownloadThread
-from ..services.multipart_downloader import download_file_in_parts, MULTIPART_DOWNLOADER_AVAILABLE
+from ..services.multipart_downloader import download_file_in_parts, MULTIPART_DOWNLOADER_AVAILABLE, PauseEvent
 from ..core.workers import PostProcessorWorker  
 from ..core.workers import PostProcessorSignals
 from ..core.api_client import download_from_api
@@ -60,7 +60,7 @@ from ..config.constants import *
 from ..utils.file_utils import KNOWN_NAMES, clean_folder_name
 from ..utils.network_utils import extract_post_info, prepare_cookies_for_request
 from ..utils.resolution import setup_ui
-from ..utils.resolution import get_dark_theme
+from ..utils.resolution import get_dark_theme, set_app_stylesheet
 from ..utils.command import parse_commands_from_text
 from ..i18n.translator import get_translation
 from .dialogs.EmptyPopupDialog import EmptyPopupDialog
@@ -170,7 +170,7 @@ class DownloaderApp (QWidget ):
         self.interrupted_session_data = None
         self.is_restore_pending = False
         self.external_link_download_thread = None
-        self.pause_event = threading.Event()
+        self.pause_event = PauseEvent()
         self.active_futures = []
         self.total_posts_to_process = 0
         self.dynamic_character_filter_holder = DynamicFilterHolder()
@@ -311,6 +311,7 @@ class DownloaderApp (QWidget ):
         self.url_label_widget = None
         self.download_location_label_widget = None
         self.remove_from_filename_label_widget = None
+        self.remove_from_filename_role = "remove_words" # Or "discord_token" while a discord.com URL is entered
         self.skip_words_label_widget = None
         self.setWindowTitle("Kemono Downloader v7.4.0")
         setup_ui(self)
@@ -466,9 +467,9 @@ class DownloaderApp (QWidget ):
         """Applies the theme and prompts the user to restart."""
         if self.current_theme == "dark":
             scale = getattr(self, 'scale_factor', 1)
-            self.setStyleSheet(get_dark_theme(scale))
+            set_app_stylesheet(get_dark_theme(scale))
         else:
-            self.setStyleSheet("")
+            set_app_stylesheet("")
         msg_box = QMessageBox(self)
         msg_box.setIcon(QMessageBox.Information)
         msg_box.setWindowTitle(self._tr("theme_change_title", "Theme Changed"))
@@ -3389,6 +3390,7 @@ class DownloaderApp (QWidget ):
         is_official_discord_url = 'discord.com' in url_text and is_any_discord_url
 
         if is_official_discord_url:
+            self.remove_from_filename_role = "discord_token"
             self.remove_from_filename_label_widget.setText("🔑 Discord Token:")
             self.remove_from_filename_input.setPlaceholderText("Enter your Discord Authorization Token here")
             self.remove_from_filename_input.setEchoMode(QLineEdit.Password) 
@@ -3397,6 +3399,7 @@ class DownloaderApp (QWidget ):
                 self.remove_from_filename_input.setText(saved_token)
         else:
             # Revert to the standard input for Kemono, Coomer, etc.
+            self.remove_from_filename_role = "remove_words"
             self.remove_from_filename_label_widget.setText(self._tr("remove_words_from_name_label", "✂️ Remove Words from name:"))
             self.remove_from_filename_input.setPlaceholderText(self._tr("remove_from_filename_input_placeholder_text", "e.g., patreon, HD"))
             self.remove_from_filename_input.setEchoMode(QLineEdit.Normal)
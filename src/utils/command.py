@@ -1,4 +1,5 @@
-import re
+import functools
+from types import MappingProxyType
 
 # Command constants
 CMD_ARCHIVE_ONLY = 'ao'
@@ -6,6 +7,16 @@ CMD_DOMAIN_OVERRIDE_PREFIX = '.'
 CMD_SFP_PREFIX = 'sfp-'
 CMD_UNKNOWN = 'unknown' # New command constant
 
+# Commands without a payload, mapped to the flag they set
+_FLAG_COMMANDS = {
+    CMD_ARCHIVE_ONLY: 'archive_only',
+    CMD_UNKNOWN: 'handle_unknown',
+}
+
+# Shared result for text without commands
+_NO_COMMANDS = MappingProxyType({})
+
+@functools.lru_cache(maxsize=4096)
 def parse_commands_from_text(raw_text: str):
     """
     Parses special commands from a text string and returns the cleaned text
@@ -14,36 +25,54 @@ def parse_commands_from_text(raw_text: str):
     Commands are in the format [command].
     Example: "Tifa, (Cloud, Zack) [.st] [sfp-10] [unknown]"
 
+    Results are cached per input string, so the same text is only parsed once.
+
     Returns:
-        tuple[str, dict]: A tuple containing:
-                          - The text string with commands removed.
-                          - A dictionary of commands and their values.
+        tuple[str, Mapping]: A tuple containing:
+                             - The text string with commands removed.
+                             - A read-only mapping of commands and their values
+                               (shared between calls; copy it with dict() to modify).
     """
-    command_pattern = re.compile(r'\[(.*?)\]')
+    # Most names carry no commands at all; skip the scan for them
+    if not raw_text or '[' not in raw_text:
+        return (raw_text or '').strip(), _NO_COMMANDS
+
     commands = {}
-    
-    def command_replacer(match):
-        command_str = match.group(1).strip().lower()
-        
-        if command_str.startswith(CMD_DOMAIN_OVERRIDE_PREFIX):
-            tld = command_str[len(CMD_DOMAIN_OVERRIDE_PREFIX):]
-            if 'domain_override' not in commands:
-                commands['domain_override'] = tld
-        elif command_str == CMD_ARCHIVE_ONLY:
-            commands['archive_only'] = True
-        elif command_str.startswith(CMD_SFP_PREFIX):
-            try:
-                threshold_str = command_str[len(CMD_SFP_PREFIX):]
-                threshold = int(threshold_str)
-                if 'sfp_threshold' not in commands:
-                    commands['sfp_threshold'] = threshold
-            except (ValueError, IndexError):
-                pass
-        elif command_str == CMD_UNKNOWN: # Logic to handle the new command
-            commands['handle_unknown'] = True
-            
-        return ''
-
-    text_without_commands = command_pattern.sub(command_replacer, raw_text).strip()
-    
-    return text_without_commands, commands
\ No newline at end of file
+    kept_parts = []
+    pos = 0
+    text_len = len(raw_text)
+
+    # Single pass: copy text between commands, apply each [command] in place
+    while pos < text_len:
+        open_idx = raw_text.find('[', pos)
+        if open_idx < 0:
+            kept_parts.append(raw_text[pos:])
+            break
+        close_idx = raw_text.find(']', open_idx + 1)
+        if close_idx < 0:
+            kept_parts.append(raw_text[pos:])
+            break
+        kept_parts.append(raw_text[pos:open_idx])
+        _apply_command(raw_text[open_idx + 1:close_idx].strip().lower(), commands)
+        pos = close_idx + 1
+
+    return "".join(kept_parts).strip(), MappingProxyType(commands)
+
+
+def _apply_command(command_str, commands):
+    """Records a single lowercased command body (without brackets) into the commands dict."""
+    flag = _FLAG_COMMANDS.get(command_str)
+    if flag:
+        commands[flag] = True
+    elif command_str.startswith(CMD_DOMAIN_OVERRIDE_PREFIX):
+        tld = command_str[len(CMD_DOMAIN_OVERRIDE_PREFIX):]
+        if 'domain_override' not in commands:
+            commands['domain_override'] = tld
+    elif command_str.startswith(CMD_SFP_PREFIX):
+        try:
+            threshold_str = command_str[len(CMD_SFP_PREFIX):]
+            threshold = int(threshold_str)
+            if 'sfp_threshold' not in commands:
+                commands['sfp_threshold'] = threshold
+        except (ValueError, IndexError):
+            pass
@@ -2,6 +2,7 @@
 
 # --- Standard Library Imports ---
 import os
+import functools
 
 # --- PyQt5 Imports ---
 from PyQt5.QtWidgets import (
@@ -524,9 +525,11 @@ def setup_ui(main_app):
     if hasattr(main_app, 'favorite_mode_checkbox'):
         main_app._handle_favorite_mode_toggle(False)
 
+@functools.lru_cache(maxsize=8)
 def get_dark_theme(scale=1):
     """
     Generates the stylesheet for the dark theme, scaled by the given factor.
+    The result is cached per scale, since every themed dialog asks for it.
     """
     # Adjust base font size for better readability
     font_size_base = 9.5
@@ -587,6 +590,15 @@ def get_dark_theme(scale=1):
     QSplitter::handle:vertical {{ height: {int(5 * scale)}px; }}
     """
 
+def set_app_stylesheet(stylesheet):
+    """
+    Sets the application-wide stylesheet, skipping the call when it is already active,
+    since every setStyleSheet re-polishes all widgets on the GUI thread.
+    """
+    app = QApplication.instance()
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+
 def apply_theme_to_app(main_app, theme_name, initial_load=False):
     """
     Applies the selected theme and scaling to the main application window.
@@ -596,13 +608,14 @@ def apply_theme_to_app(main_app, theme_name, initial_load=False):
         main_app.settings.setValue(THEME_KEY, theme_name)
         main_app.settings.sync()
 
+    # Applied once to the whole application so every window and dialog inherits it
     if theme_name == "dark":
         scale = getattr(main_app, 'scale_factor', 1)
-        main_app.setStyleSheet(get_dark_theme(scale))
+        set_app_stylesheet(get_dark_theme(scale))
         if not initial_load:
             main_app.log_signal.emit("🎨 Switched to Dark Mode.")
     else:
-        main_app.setStyleSheet("")
+        set_app_stylesheet("")
         if not initial_load:
             main_app.log_signal.emit("🎨 Switched to Light Mode.")
     main_app.update()